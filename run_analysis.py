@@ -18,20 +18,27 @@ import gc
 import re
 import platform
 import contextlib
+import threading
 import warnings
 import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import date as date_cls, datetime, timedelta
 from dataclasses import replace
 from loguru import logger
 import questionary
-from rich.console import Console
+from rich.console import Console, Group
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
+from rich.text import Text
 from rich import print as rprint
 import time
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import yaml
 
 # Add src to path
@@ -41,6 +48,7 @@ from config.config import (
     RUN_CONFIG_ENV,
     build_run_config,
     get_energy_price_profiles,
+    get_scenario_policy,
     load_config,
     ensure_directories,
     DATA_RAW_DIR,
@@ -57,15 +65,16 @@ from src.cleaning.data_validator import EPCDataValidator
 from src.analysis.archetype_analysis import ArchetypeAnalyzer
 from src.modeling.scenario_model import ScenarioModeler
 from src.modeling.pathway_model import PathwayModeler
-from src.modeling.contracts import HN_READY_TIERS, join_spatial_enrichment
+from src.modeling.contracts import HN_READY_TIERS, TIER_READINESS_LABELS, join_spatial_enrichment
 from src.reporting.comparisons import ComparisonReporter, build_stock_scenario_comparison
-from src.utils.analysis_logger import AnalysisLogger
+from src.utils.analysis_logger import AnalysisLogger, convert_to_json_serializable
 from src.utils.staged_dataset import DatasetReference, parquet_row_count
 from src.utils.staged_processing import (
     apply_adjustments_staged_dataset,
     validate_staged_dataset,
 )
 from src.utils.diagnostic_phase import DiagnosticPathwayPhaseError
+from src.utils.profiling import get_worker_count
 from src.utils.run_integrity import (
     ArtifactManifest,
     RunContext,
@@ -78,7 +87,8 @@ from src.ui import create_dashboard
 from src.ui.formatters import format_duration
 
 
-console = Console()
+# Markup is explicit throughout, so rich's automatic repr highlighting is off.
+console = Console(highlight=False)
 
 EXIT_SUCCESS = 0
 EXIT_ANALYSIS_FAILED = 1
@@ -96,6 +106,19 @@ PHASE_VALIDATION = "Validation"
 PHASE_MODELLING = "Modelling"
 PHASE_OUTPUTS = "Outputs"
 
+DOWNLOAD_SCOPE_FULL_LONDON = "All London boroughs (full dataset)"
+DOWNLOAD_SCOPE_SINGLE_BOROUGH = "Single borough (testing)"
+DOWNLOAD_SCOPE_CHOICES = (DOWNLOAD_SCOPE_FULL_LONDON, DOWNLOAD_SCOPE_SINGLE_BOROUGH)
+DOWNLOAD_SCOPE_ALIASES = {
+    "full-london": DOWNLOAD_SCOPE_FULL_LONDON,
+    "single-borough": DOWNLOAD_SCOPE_SINGLE_BOROUGH,
+}
+# Rows per row group in the validated Parquet written by validate_data.
+VALIDATED_PARQUET_ROW_GROUP_SIZE = 65_536
+
+# Borough prompt choices, built once from the downloader's LA code table.
+LONDON_BOROUGH_CHOICES = tuple(sorted(EPCAPIDownloader.LONDON_LA_CODES))
+
 EXPECTED_STAGED_DOWNLOAD_DATA_MARKERS = (
     "download_national_domestic_dataset(",
     "materialize_full_load_subset(",
@@ -282,8 +305,6 @@ def _register_required_artifacts(
 
 def _load_adjusted_phase_frame(phase_name: str):
     """Load the run-scoped adjusted Parquet boundary for an analytical phase."""
-    import pandas as pd
-
     spatial_path = Path(DATA_PROCESSED_DIR) / "epc_london_adjusted_spatial.parquet"
     path = spatial_path if spatial_path.is_file() else Path(DATA_PROCESSED_DIR) / "epc_london_adjusted.parquet"
     if not path.is_file():
@@ -1390,6 +1411,19 @@ def sample_window_matches(file_path: Path, sample_start_date: date_cls, sample_e
     )
 
 
+def count_csv_records(file_path: Path, chunk_size: int = 1 << 20) -> int:
+    """Count data rows in a CSV by scanning newline bytes rather than decoding lines."""
+    line_count = 0
+    last_byte = b""
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            line_count += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    if last_byte and last_byte != b"\n":
+        line_count += 1  # Final row without a trailing newline
+    return max(line_count - 1, 0)  # Subtract header
+
+
 def is_dataset_reference(value) -> bool:
     """Return True when the value is a staged dataset reference."""
     return isinstance(value, DatasetReference)
@@ -1456,8 +1490,6 @@ def normalize_validation_report(report: Optional[Dict[str, Any]], *, input_datas
 
 def write_json_report(file_path: Path, payload: Dict[str, Any]) -> None:
     """Write a JSON report with numpy-safe serialization."""
-    from src.utils.analysis_logger import convert_to_json_serializable
-
     with open(file_path, "w", encoding="utf-8") as f:
         json.dump(convert_to_json_serializable(payload), f, indent=2)
 
@@ -1489,6 +1521,10 @@ def is_one_stop_only(config=None) -> bool:
 
 def print_header():
     """Print welcome header."""
+    if not getattr(console, "is_terminal", False):
+        # Redirected/CI output: skip the clear sequence and Panel rendering.
+        logger.info("Heat Street EPC Analysis - Complete Interactive Pipeline")
+        return
     console.clear()
     rprint(Panel.fit(
         "[bold cyan]Heat Street EPC Analysis[/bold cyan]\n"
@@ -1499,32 +1535,27 @@ def print_header():
     print()
 
 
+def _print_phase_banner(title: str) -> None:
+    """Print a phase banner framed by blank lines in a single console write."""
+    console.print(Group(Text(), Panel(f"[bold]{title}[/bold]", border_style="blue"), Text()))
+
+
 def check_credentials(ui=None):
     """Check if the API token is configured."""
     token = os.getenv('EPC_API_TOKEN')
 
     if not token:
         _ui_warning(ui, "EPC API token missing")
-        console.print("[yellow]⚠[/yellow]  API token not found in .env file", style="yellow")
-        console.print()
-
-        if not Path('.env').exists():
-            console.print("Creating .env file from template...")
-            if Path('.env.example').exists():
-                import shutil
-                shutil.copy('.env.example', '.env')
-                console.print("[green]✓[/green] Created .env file")
-            else:
-                # Create .env file
-                with open('.env', 'w') as f:
-                    f.write("# EPC API Credentials\n")
-                    f.write("EPC_API_TOKEN=\n")
-                console.print("[green]✓[/green] Created .env file")
-
-        console.print()
-        console.print("[cyan]Please enter your EPC API bearer token:[/cyan]")
-        console.print("[dim]Get the token from your my account page on the Energy Certificate Data API service.[/dim]")
-        console.print()
+        # .env is written once, after the prompt: any template copied here would
+        # be overwritten by write_epc_token_env straight away.
+        console.print(Group(
+            "[yellow]⚠  API token not found in .env file[/yellow]",
+            "",
+            "",
+            "[cyan]Please enter your EPC API bearer token:[/cyan]",
+            "[dim]Get the token from your my account page on the Energy Certificate Data API service.[/dim]",
+            "",
+        ))
 
         with _ui_suspend(ui, "Waiting for EPC API token"):
             token = questionary.password(
@@ -1545,12 +1576,10 @@ def check_credentials(ui=None):
             console.print("[red]×[/red] Permission denied while saving .env", style="red")
             return False
 
-        # Reload environment
-        from dotenv import load_dotenv
-        load_dotenv(override=True)
+        # .env now holds only the token, so export it directly instead of re-reading the file.
+        os.environ['EPC_API_TOKEN'] = token.strip()
 
-        console.print("[green]✓[/green] API token saved to .env file")
-        console.print()
+        console.print(Group("[green]✓[/green] API token saved to .env file", ""))
 
     _ui_metric(ui, "EPC API token", "configured", group=PHASE_ACQUISITION)
     return True
@@ -1558,41 +1587,46 @@ def check_credentials(ui=None):
 
 def ask_hnpd_download(ui=None):
     """Ask if user wants to download BEIS Heat Network Planning Database."""
-    console.print()
-    console.print("[cyan]BEIS Heat Network Planning Database (Recommended)[/cyan]")
-    console.print()
-    console.print("The HNPD provides current heat network data (January 2024) for:")
-    console.print("  • Operational heat networks across the UK")
-    console.print("  • Networks under construction")
-    console.print("  • Planned networks with planning permission")
-    console.print("  • Current external evidence for Tier 1-2 heat network proximity")
-    console.print()
+    console.print(Group(
+        "",
+        "[cyan]BEIS Heat Network Planning Database (Recommended)[/cyan]",
+        "",
+        "The HNPD provides current heat network data (January 2024) for:",
+        "  • Operational heat networks across the UK",
+        "  • Networks under construction",
+        "  • Planned networks with planning permission",
+        "  • Current external evidence for Tier 1-2 heat network proximity",
+        "",
+    ))
 
     # Check if already downloaded
     hnpd_downloader = HNPDDownloader()
     summary = hnpd_downloader.get_data_summary()
 
     if summary['available']:
-        console.print("[green]✓[/green] HNPD data already downloaded")
         _ui_metric(ui, "HNPD", "available", group=PHASE_ACQUISITION)
-        console.print(f"    Total records: {summary['total_records']}")
-        console.print(f"    Tier 1 networks: {summary['tier_1_networks']} (operational/under construction)")
-        console.print(f"    Tier 2 networks: {summary['tier_2_networks']} (planning granted)")
-        console.print(f"    Regions covered: {summary['region_count']}")
+        console.print(Group(
+            "[green]✓[/green] HNPD data already downloaded",
+            f"    Total records: {summary['total_records']}",
+            f"    Tier 1 networks: {summary['tier_1_networks']} (operational/under construction)",
+            f"    Tier 2 networks: {summary['tier_2_networks']} (planning granted)",
+            f"    Regions covered: {summary['region_count']}",
+        ))
         return True
 
     download = True  # Automatically download HNPD data
 
     if download:
-        console.print()
-        console.print("[cyan]Downloading BEIS Heat Network Planning Database...[/cyan]")
+        console.print(Group("", "[cyan]Downloading BEIS Heat Network Planning Database...[/cyan]"))
 
         if hnpd_downloader.download_and_prepare():
             _ui_metric(ui, "HNPD", "downloaded", group=PHASE_ACQUISITION)
-            console.print("[green]✓[/green] HNPD data downloaded and ready")
             summary = hnpd_downloader.get_data_summary()
-            console.print(f"    {summary['total_records']} heat network records loaded")
-            console.print(f"    {summary['tier_1_networks']} Tier 1 + {summary['tier_2_networks']} Tier 2 networks")
+            console.print(Group(
+                "[green]✓[/green] HNPD data downloaded and ready",
+                f"    {summary['total_records']} heat network records loaded",
+                f"    {summary['tier_1_networks']} Tier 1 + {summary['tier_2_networks']} Tier 2 networks",
+            ))
             return True
         else:
             _ui_warning(
@@ -1614,6 +1648,51 @@ def ask_hnpd_download(ui=None):
     return False
 
 
+def _find_reusable_borough_subset(
+    borough_name: str,
+    sample_start_date: date_cls = None,
+    sample_end_date: date_cls = None,
+) -> Optional[Path]:
+    """Return a previously saved borough subset matching the requested scope, if any."""
+    if not (sample_start_date and sample_end_date):
+        return None
+    borough_slug = borough_name.lower().replace(" ", "_")
+    parquet_path = DATA_RAW_DIR / f"epc_{borough_slug}_filtered.parquet"
+    if not parquet_path.is_file():
+        return None
+    # The CSV and its parquet sibling share one sidecar, so this checks the scope
+    # the subset was written for without opening the dataset itself.
+    if not sample_window_matches(parquet_path, sample_start_date, sample_end_date):
+        return None
+    try:
+        columns = pq.read_schema(parquet_path).names
+    except Exception as e:
+        logger.debug(f"Could not read existing borough subset schema {parquet_path}: {e}")
+        return None
+    if EPCAPIDownloader.get_missing_stock_definition_columns(pd.DataFrame(columns=columns)):
+        return None
+    return parquet_path
+
+
+def _confirm_reuse_borough_subset(ui, borough_name: str, parquet_path: Path) -> bool:
+    """Ask whether an existing borough subset for the same scope should be reused."""
+    message = f"Filtered {borough_name} dataset for this sample window already exists. Reuse it?"
+    tui_choice = _tui_prompt(
+        ui, "select",
+        title="Existing borough data found",
+        message=message,
+        choices=[True, False],
+        labels=[f"Reuse {parquet_path.name}", "Download again (will overwrite existing)"],
+    )
+    if tui_choice is not None:
+        return bool(tui_choice)
+    with _ui_suspend(ui, "Waiting for existing borough data decision"):
+        answer = questionary.confirm(message, default=True).ask()
+    if answer is None:
+        raise AnalysisCancelled("Download cancelled by user")
+    return bool(answer)
+
+
 def download_data(
     analysis_logger: AnalysisLogger = None,
     sample_start_date: date_cls = None,
@@ -1621,27 +1700,32 @@ def download_data(
     ui=None,
     download_scope: Optional[str] = None,
     borough: Optional[str] = None,
+    fresh: bool = False,
+    use_existing: bool = False,
 ):
-    """Download EPC data via API."""
-    console.print()
-    console.print(Panel("[bold]Phase 1: Data Download[/bold]", border_style="blue"))
-    console.print()
+    """
+    Download EPC data via API.
+
+    A borough subset left by an earlier run for the same sample window is
+    skipped when ``fresh`` is set, reused without asking when ``use_existing``
+    is set, and otherwise only offered for reuse when the scope or borough was
+    chosen interactively, so a fully specified CLI run never prompts.
+    """
+    _print_phase_banner("Phase 1: Data Download")
     _ui_phase_started(ui, "Data Download", "Preparing EPC acquisition")
 
     from_year = sample_start_date.year if sample_start_date else 2015
 
-    scope_map = {
-        "full-london": "All London boroughs (full dataset)",
-        "single-borough": "Single borough (testing)",
-    }
-    download_scope = scope_map.get(download_scope, download_scope)
+    download_scope = DOWNLOAD_SCOPE_ALIASES.get(download_scope, download_scope)
+    interactive = download_scope is None or (
+        download_scope == DOWNLOAD_SCOPE_SINGLE_BOROUGH and not borough
+    )
     if download_scope is None:
-        _scope_choices = ["All London boroughs (full dataset)", "Single borough (testing)"]
         tui_scope = _tui_prompt(
             ui, "select",
             title="Download scope",
             message="Select EPC download scope:",
-            choices=_scope_choices,
+            choices=list(DOWNLOAD_SCOPE_CHOICES),
         )
         if tui_scope is not None:
             download_scope = tui_scope
@@ -1649,21 +1733,20 @@ def download_data(
             with _ui_suspend(ui, "Waiting for EPC download scope"):
                 download_scope = questionary.select(
                     "Select download scope:",
-                    choices=_scope_choices,
+                    choices=list(DOWNLOAD_SCOPE_CHOICES),
                 ).ask()
 
     if not download_scope:
         raise AnalysisCancelled("Download cancelled by user")
 
     selected_borough = borough
-    if download_scope == "Single borough (testing)":
+    if download_scope == DOWNLOAD_SCOPE_SINGLE_BOROUGH:
         if not selected_borough:
-            _borough_list = sorted(EPCAPIDownloader.LONDON_LA_CODES.keys())
             tui_borough = _tui_prompt(
                 ui, "select",
                 title="Borough selection",
                 message="Select London borough:",
-                choices=_borough_list,
+                choices=list(LONDON_BOROUGH_CHOICES),
             )
             if tui_borough is not None:
                 selected_borough = tui_borough
@@ -1671,7 +1754,7 @@ def download_data(
                 with _ui_suspend(ui, "Waiting for borough selection"):
                     selected_borough = questionary.autocomplete(
                         "Select borough:",
-                        choices=list(EPCAPIDownloader.LONDON_LA_CODES.keys()),
+                        choices=list(LONDON_BOROUGH_CHOICES),
                     ).ask()
 
         if not selected_borough:
@@ -1691,6 +1774,45 @@ def download_data(
 
     try:
         if selected_borough:
+            existing_filtered = None if fresh else _find_reusable_borough_subset(
+                selected_borough,
+                sample_start_date=sample_start_date,
+                sample_end_date=sample_end_date,
+            )
+            reuse_existing = False
+            if existing_filtered is not None:
+                if use_existing:
+                    reuse_existing = True
+                elif interactive:
+                    reuse_existing = _confirm_reuse_borough_subset(ui, selected_borough, existing_filtered)
+                else:
+                    console.print(
+                        f"[cyan]Existing {selected_borough} subset {existing_filtered.name} found; "
+                        "downloading again (pass --use-existing to reuse it).[/cyan]"
+                    )
+            if reuse_existing:
+                df_filtered = pd.read_parquet(existing_filtered)
+                console.print(
+                    f"[green]✓[/green] Reusing filtered {selected_borough} pre-1930 terraced house records: "
+                    f"{len(df_filtered):,} ({existing_filtered.name})"
+                )
+                if analysis_logger:
+                    analysis_logger.add_metric("filtered_records", len(df_filtered), "London pre-1930 terraced houses after filtering")
+                    analysis_logger.add_metric("filtered_pre_1930_terraced_house_records", len(df_filtered), "London pre-1930 terraced house records after filtering")
+                    analysis_logger.add_metric("from_year", from_year)
+                    analysis_logger.add_output(f"data/raw/{existing_filtered.name}", "parquet", "Filtered pre-1930 terraced houses (reused)")
+                    analysis_logger.complete_phase(
+                        success=True,
+                        message=f"Reused {len(df_filtered):,} {selected_borough} pre-1930 terraced houses from {existing_filtered.name}",
+                    )
+                _ui_metric(ui, "filtered stock records", len(df_filtered), group=PHASE_ACQUISITION)
+                _ui_phase_completed(
+                    ui,
+                    "Data Download",
+                    f"Reused {len(df_filtered):,} pre-1930 terraced house records",
+                )
+                return df_filtered
+
             console.print(
                 f"[cyan]Using EPC full-load CSV extract as the stock-definition source for {selected_borough}...[/cyan]"
             )
@@ -1949,6 +2071,20 @@ def download_data(
         return None
 
 
+def _text_columns_for_parquet(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a shallow copy with object/categorical columns as text for Parquet.
+
+    Missing values stay null, so the Parquet reads back with the same gaps as
+    the CSV written alongside it; the caller's frame keeps its own dtypes.
+    """
+    df_parquet = df.copy(deep=False)
+    for col in df_parquet.select_dtypes(include=['category', 'object']).columns:
+        values = df_parquet[col]
+        df_parquet[col] = values.astype(str).where(values.notna())
+    return df_parquet
+
+
 def validate_data(
     df,
     analysis_logger: AnalysisLogger = None,
@@ -1958,9 +2094,7 @@ def validate_data(
     strict_schema_conflicts: bool = False,
 ):
     """Validate and clean data."""
-    console.print()
-    console.print(Panel("[bold]Phase 2: Data Validation[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 2: Data Validation")
     _ui_phase_started(ui, "Data Validation", "Running quality assurance checks")
 
     if analysis_logger:
@@ -2080,7 +2214,6 @@ def validate_data(
         analysis_logger.add_metric("negative_co2_values", report.get('negative_co2_values', 0), "Records with negative CO2_EMISSIONS_CURRENT")
 
     # Save validated data
-    import pandas as pd
     output_file = DATA_PROCESSED_DIR / "epc_london_validated.csv"
     df_validated.to_csv(output_file, index=False)
     if sample_start_date and sample_end_date:
@@ -2094,24 +2227,17 @@ def validate_data(
     # Try to save parquet (optional for performance)
     try:
         parquet_file = output_file.with_suffix('.parquet')
-        # Convert object/categorical columns to strings for parquet compatibility
-        # Save original dtypes to restore after
-        cat_cols = df_validated.select_dtypes(include=['category']).columns.tolist()
-        obj_cols = df_validated.select_dtypes(include=['object']).columns.tolist()
-        cols_to_convert = cat_cols + obj_cols
-
-        if cols_to_convert:
-            original_dtypes = {col: df_validated[col].dtype for col in cols_to_convert}
-            for col in cols_to_convert:
-                df_validated[col] = df_validated[col].astype(str)
-
-        df_validated.to_parquet(parquet_file, index=False)
-
-        # Restore original dtypes
-        if cols_to_convert:
-            for col, dtype in original_dtypes.items():
-                if col in df_validated.columns:
-                    df_validated[col] = df_validated[col].astype(dtype)
+        df_parquet = _text_columns_for_parquet(df_validated)
+        # Bounded row groups let the column-projected readers downstream
+        # (lodgement tables, standalone analysis scripts) skip what they don't need.
+        pq.write_table(
+            pa.Table.from_pandas(df_parquet, preserve_index=False),
+            parquet_file,
+            compression='zstd',
+            compression_level=3,
+            row_group_size=VALIDATED_PARQUET_ROW_GROUP_SIZE,
+        )
+        del df_parquet
     except Exception as e:
         console.print(f"[yellow]Note: Could not save parquet format (CSV saved successfully)[/yellow]")
         logger.debug(f"Parquet save failed: {e}")
@@ -2153,9 +2279,7 @@ def apply_methodological_adjustments(
     ui=None,
 ):
     """Apply evidence-based methodological adjustments."""
-    console.print()
-    console.print(Panel("[bold]Phase 2.5: Methodological Adjustments[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 2.5: Methodological Adjustments")
     _ui_phase_started(ui, "Methodological Adjustments", "Applying evidence-based adjustments")
 
     if analysis_logger:
@@ -2243,23 +2367,7 @@ def apply_methodological_adjustments(
     parquet_file = None
     try:
         parquet_file = output_file.with_suffix(".parquet")
-        # Convert object/categorical columns to strings for parquet compatibility
-        cat_cols = df_adjusted.select_dtypes(include=['category']).columns.tolist()
-        obj_cols = df_adjusted.select_dtypes(include=['object']).columns.tolist()
-        cols_to_convert = cat_cols + obj_cols
-
-        if cols_to_convert:
-            original_dtypes = {col: df_adjusted[col].dtype for col in cols_to_convert}
-            for col in cols_to_convert:
-                df_adjusted[col] = df_adjusted[col].astype(str)
-
-        df_adjusted.to_parquet(parquet_file, index=False)
-
-        # Restore original dtypes
-        if cols_to_convert:
-            for col, dtype in original_dtypes.items():
-                if col in df_adjusted.columns:
-                    df_adjusted[col] = df_adjusted[col].astype(dtype)
+        _text_columns_for_parquet(df_adjusted).to_parquet(parquet_file, index=False)
     except Exception as e:
         parquet_file = None
         logger.debug(f"Could not save adjusted parquet: {e}")
@@ -2362,9 +2470,7 @@ def ensure_hp_hn_comparison_outputs(df=None, analysis_logger: AnalysisLogger = N
 
 def analyze_archetype(df, analysis_logger: AnalysisLogger = None, ui=None):
     """Run archetype characterization."""
-    console.print()
-    console.print(Panel("[bold]Phase 3: Archetype Analysis[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 3: Archetype Analysis")
     _ui_phase_started(ui, "Archetype Analysis", "Analyzing property characteristics")
 
     if analysis_logger:
@@ -2384,21 +2490,26 @@ def analyze_archetype(df, analysis_logger: AnalysisLogger = None, ui=None):
 
     # Show key findings
     if 'epc_bands' in results and results['epc_bands'] and 'frequency' in results['epc_bands']:
-        console.print()
-        console.print("[cyan]EPC Band Distribution:[/cyan]")
-        for band in ['D', 'E', 'F', 'G']:
-            if band in results['epc_bands']['frequency']:
-                count = results['epc_bands']['frequency'][band]
-                pct = results['epc_bands']['percentage'][band]
-                console.print(f"    Band {band}: {count:,} ({pct:.1f}%)")
-                _ui_metric(ui, f"EPC band {band}", count, group=PHASE_MODELLING)
-
-        if analysis_logger:
-            for band in ['D', 'E', 'F', 'G']:
-                if band in results['epc_bands']['frequency']:
-                    count = results['epc_bands']['frequency'][band]
-                    pct = results['epc_bands']['percentage'][band]
-                    analysis_logger.add_metric(f"epc_band_{band}", count, f"Band {band}: {pct:.1f}%")
+        # One aligned D-G table serves the console, the UI and the analysis log.
+        band_table = pd.DataFrame({
+            'count': pd.Series(results['epc_bands']['frequency'], dtype='float64'),
+            'pct': pd.Series(results['epc_bands']['percentage'], dtype='float64'),
+        }).reindex(['D', 'E', 'F', 'G']).dropna(subset=['count'])
+        band_table['count'] = band_table['count'].astype('int64')
+        band_table['pct'] = band_table['pct'].fillna(0.0)
+
+        console.print(Group(
+            Text(),
+            "[cyan]EPC Band Distribution:[/cyan]",
+            *(
+                f"    Band {band}: {row.count:,} ({row.pct:.1f}%)"
+                for band, row in zip(band_table.index, band_table.itertuples(index=False))
+            ),
+        ))
+        for band, count, pct in zip(band_table.index, band_table['count'].tolist(), band_table['pct'].tolist()):
+            _ui_metric(ui, f"EPC band {band}", count, group=PHASE_MODELLING)
+            if analysis_logger:
+                analysis_logger.add_metric(f"epc_band_{band}", count, f"Band {band}: {pct:.1f}%")
     else:
         console.print()
         console.print("[yellow]Note: EPC band distribution analysis could not be completed (missing required columns)[/yellow]")
@@ -2416,9 +2527,7 @@ def analyze_archetype(df, analysis_logger: AnalysisLogger = None, ui=None):
 
 def model_scenarios(df, analysis_logger: AnalysisLogger = None, ui=None):
     """Run scenario modeling."""
-    console.print()
-    console.print(Panel("[bold]Phase 4: Scenario Modeling[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 4: Scenario Modeling")
     _ui_phase_started(ui, "Scenario Modeling", "Modeling decarbonization scenarios")
 
     if analysis_logger:
@@ -2440,23 +2549,23 @@ def model_scenarios(df, analysis_logger: AnalysisLogger = None, ui=None):
     console.print(f"[green]✓[/green] Scenario modeling complete")
 
     # Show summary
-    console.print()
-    console.print("[cyan]Scenario Summary:[/cyan]")
+    summary_lines = ["", "[cyan]Scenario Summary:[/cyan]"]
     if scenario_results:
         for scenario, results in scenario_results.items():
             if 'capital_cost_per_property' in results:
                 cost_per_property = results['capital_cost_per_property']
                 _ui_metric(ui, f"{scenario} status", "complete", group=PHASE_MODELLING)
                 _ui_metric(ui, f"{scenario} cost/property", cost_per_property, group=PHASE_MODELLING)
-                console.print(f"    {scenario}: £{results['capital_cost_per_property']:,.0f} per property")
+                summary_lines.append(f"    {scenario}: £{results['capital_cost_per_property']:,.0f} per property")
                 if analysis_logger:
                     analysis_logger.add_metric(f"scenario_{scenario}_cost", cost_per_property, f"Capital cost per property")
             else:
-                console.print(f"    {scenario}: Analysis incomplete (missing required data)")
+                summary_lines.append(f"    {scenario}: Analysis incomplete (missing required data)")
                 _ui_metric(ui, f"{scenario} status", "skipped", group=PHASE_MODELLING)
     else:
-        console.print("[yellow]Note: Scenario modeling could not be completed (missing required columns)[/yellow]")
+        summary_lines.append("[yellow]Note: Scenario modeling could not be completed (missing required columns)[/yellow]")
         _ui_warning(ui, "Scenario modeling could not be completed")
+    console.print(Group(*summary_lines))
 
     # Subsidy analysis
     console.print()
@@ -2527,9 +2636,7 @@ def model_scenarios(df, analysis_logger: AnalysisLogger = None, ui=None):
 
 def analyze_retrofit_readiness(df, analysis_logger: AnalysisLogger = None, one_stop_only: bool = False, ui=None):
     """Analyze heat pump retrofit readiness."""
-    console.print()
-    console.print(Panel("[bold]Phase 4.3: Retrofit Readiness Analysis[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 4.3: Retrofit Readiness Analysis")
     _ui_phase_started(ui, "Retrofit Readiness Analysis", "Assessing heat pump readiness")
 
     if analysis_logger:
@@ -2538,14 +2645,16 @@ def analyze_retrofit_readiness(df, analysis_logger: AnalysisLogger = None, one_s
             "Assess heat pump readiness, fabric pre-requisites, and retrofit costs"
         )
 
-    console.print("[cyan]Assessing heat pump readiness and barriers...[/cyan]")
-    console.print()
-    console.print("This phase analyzes:")
-    console.print("  • Current heat pump suitability")
-    console.print("  • Required fabric pre-requisites")
-    console.print("  • Pre-retrofit cost barriers")
-    console.print("  • Heat demand before/after fabric improvements")
-    console.print()
+    console.print(Group(
+        "[cyan]Assessing heat pump readiness and barriers...[/cyan]",
+        "",
+        "This phase analyzes:",
+        "  • Current heat pump suitability",
+        "  • Required fabric pre-requisites",
+        "  • Pre-retrofit cost barriers",
+        "  • Heat demand before/after fabric improvements",
+        "",
+    ))
 
     try:
         from src.analysis.retrofit_readiness import RetrofitReadinessAnalyzer
@@ -2566,39 +2675,43 @@ def analyze_retrofit_readiness(df, analysis_logger: AnalysisLogger = None, one_s
         df_readiness = result["readiness_frame"]
         summary = result["summary"]
 
-        # Display key findings
-        console.print("[green]✓[/green] Retrofit readiness analysis complete")
-        console.print()
-        console.print("[cyan]Key Findings:[/cyan]")
-        from src.modeling.contracts import TIER_READINESS_LABELS
-        for tier in range(1, 6):
-            console.print(
-                f"  {TIER_READINESS_LABELS[tier]}: "
-                f"{summary['tier_distribution'].get(tier, 0):,} properties "
-                f"({summary['tier_percentages'].get(tier, 0):.1f}%)"
-            )
-        console.print()
-        console.print(f"  Solid wall barrier: {summary['needs_solid_wall_insulation']:,} properties need SWI")
-        console.print(f"  Mean fabric cost: £{summary['mean_fabric_cost']:,.0f}")
-        console.print(f"  Total full-ASHP investment: £{summary['total_cost_full_ashp']/1e6:.1f}M")
-        console.print()
-
-        for tier in range(1, 6):
-            _ui_metric(
-                ui,
-                f"retrofit tier {tier}",
-                summary['tier_distribution'].get(tier, 0),
-                group=PHASE_MODELLING,
-            )
+        # Tiers 1-5 as aligned arrays, so missing tiers read as zero once.
+        tiers = range(1, 6)
+        tier_counts = np.asarray(
+            [summary['tier_distribution'].get(tier, 0) for tier in tiers], dtype=np.int64
+        ).tolist()
+        tier_pcts = np.asarray(
+            [summary['tier_percentages'].get(tier, 0.0) for tier in tiers], dtype=np.float64
+        ).tolist()
+
+        # Display key findings as one render rather than a print per line
+        findings = [
+            "[green]✓[/green] Retrofit readiness analysis complete",
+            "",
+            "[cyan]Key Findings:[/cyan]",
+        ]
+        findings.extend(
+            f"  {TIER_READINESS_LABELS[tier]}: {count:,} properties ({pct:.1f}%)"
+            for tier, count, pct in zip(tiers, tier_counts, tier_pcts)
+        )
+        findings.extend([
+            "",
+            f"  Solid wall barrier: {summary['needs_solid_wall_insulation']:,} properties need SWI",
+            f"  Mean fabric cost: £{summary['mean_fabric_cost']:,.0f}",
+            f"  Total full-ASHP investment: £{summary['total_cost_full_ashp']/1e6:.1f}M",
+            "",
+        ])
+        console.print(Group(*findings))
+
+        for tier, count in zip(tiers, tier_counts):
+            _ui_metric(ui, f"retrofit tier {tier}", count, group=PHASE_MODELLING)
         _ui_metric(ui, "solid wall barrier count", summary['needs_solid_wall_insulation'], group=PHASE_MODELLING)
         _ui_metric(ui, "mean fabric cost", summary['mean_fabric_cost'], group=PHASE_MODELLING)
         _ui_metric(ui, "total full-ASHP investment", summary['total_cost_full_ashp'], group=PHASE_MODELLING)
 
         if analysis_logger:
-            for tier in range(1, 6):
-                count = summary['tier_distribution'].get(tier, 0)
-                pct = summary['tier_percentages'].get(tier, 0)
-            analysis_logger.add_metric(f"retrofit_tier_{tier}", count, f"{pct:.1f}% of properties")
+            for tier, count, pct in zip(tiers, tier_counts, tier_pcts):
+                analysis_logger.add_metric(f"retrofit_tier_{tier}", count, f"{pct:.1f}% of properties")
             analysis_logger.add_metric("mean_fabric_cost", summary['mean_fabric_cost'], "Average fabric improvement cost per property")
             analysis_logger.add_metric("total_cost_full_ashp", summary['total_cost_full_ashp'], "Total full-ASHP investment needed")
 
@@ -2671,9 +2784,7 @@ def analyze_retrofit_readiness(df, analysis_logger: AnalysisLogger = None, one_s
 
 def run_spatial_analysis(df, analysis_logger: AnalysisLogger = None, one_stop_only: bool = False, ui=None):
     """Run required spatial classification; rendered map formats are optional."""
-    console.print()
-    console.print(Panel("[bold]Phase 4.5: Spatial Analysis[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 4.5: Spatial Analysis")
     _ui_phase_started(ui, "Spatial Analysis", "Checking spatial dependencies")
 
     console.print("[cyan]Heat Network Tier Classification[/cyan]")
@@ -3050,6 +3161,50 @@ def run_spatial_analysis(df, analysis_logger: AnalysisLogger = None, one_stop_on
         return None, None
 
 
+def _run_report_tasks(report_tasks) -> List[str]:
+    """Run independent report tasks, in worker processes when HEATSTREET_WORKERS > 1."""
+    if not report_tasks:
+        # Nothing to plot or export: skip the matplotlib import and generator setup.
+        return []
+
+    from src.reporting.visualizations import ReportGenerator, init_report_worker, run_report_task
+
+    errors: List[Optional[Exception]] = [None] * len(report_tasks)
+    workers = min(get_worker_count(default=1), len(report_tasks))
+    if workers <= 1:
+        generator = ReportGenerator()
+        for index, (_, method_name, args, kwargs, _) in enumerate(report_tasks):
+            try:
+                run_report_task(method_name, args, kwargs, generator=generator)
+            except Exception as e:
+                errors[index] = e
+    else:
+        # Pass the run-scoped outputs dir explicitly: spawned workers (Windows,
+        # macOS) re-import config and would not see this process's redirection.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_report_worker,
+            initargs=(DATA_OUTPUTS_DIR,),
+        ) as executor:
+            futures = {
+                executor.submit(run_report_task, method_name, args, kwargs): index
+                for index, (_, method_name, args, kwargs, _) in enumerate(report_tasks)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[futures[future]] = e
+
+    reports_created = []
+    for (label, _, _, _, failure_message), error in zip(report_tasks, errors):
+        if error is None:
+            reports_created.append(label)
+        else:
+            console.print(f"[yellow]⚠ {failure_message}: {error}[/yellow]")
+    return reports_created
+
+
 def generate_reports(
     archetype_results,
     scenario_results,
@@ -3061,9 +3216,7 @@ def generate_reports(
     one_stop_only: Optional[bool] = None,
 ):
     """Generate final reports and visualizations."""
-    console.print()
-    console.print(Panel("[bold]Phase 5: Report Generation[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 5: Report Generation")
     _ui_phase_started(ui, "Report Generation", "Generating reports and visualizations")
 
     effective_one_stop_only = is_one_stop_only() if one_stop_only is None else one_stop_only
@@ -3082,84 +3235,99 @@ def generate_reports(
 
     console.print("[cyan]Generating comprehensive reports and visualizations...[/cyan]")
 
-    from src.reporting.visualizations import ReportGenerator
-
-    generator = ReportGenerator()
-    reports_created = []
+    # Each task: (output label, ReportGenerator method, args, kwargs, failure message)
+    report_tasks = []
 
     # 1. EPC Band Distribution
     if archetype_results and 'epc_bands' in archetype_results and archetype_results['epc_bands']:
-        try:
-            generator.plot_epc_band_distribution(archetype_results['epc_bands'])
-            reports_created.append("✓ EPC band distribution chart")
-        except Exception as e:
-            console.print(f"[yellow]⚠ Could not generate EPC band chart: {e}[/yellow]")
+        report_tasks.append((
+            "✓ EPC band distribution chart",
+            "plot_epc_band_distribution", (archetype_results['epc_bands'],), {},
+            "Could not generate EPC band chart",
+        ))
 
     # 2. SAP Score Distribution
     if df_validated is not None and 'CURRENT_ENERGY_EFFICIENCY' in df_validated.columns:
         try:
-            import pandas as pd
-            sap_scores = df_validated['CURRENT_ENERGY_EFFICIENCY'].dropna()
-            if len(sap_scores) > 0:
-                generator.plot_sap_score_distribution(sap_scores)
-                reports_created.append("✓ SAP score distribution histogram")
+            # Plain float buffer: no index, and NaNs dropped with one vectorized mask.
+            sap_scores = df_validated['CURRENT_ENERGY_EFFICIENCY'].to_numpy(dtype=np.float64, na_value=np.nan)
+            sap_scores = sap_scores[~np.isnan(sap_scores)]
+            if sap_scores.size > 0:
+                from src.reporting.visualizations import ReportGenerator
+
+                # Bin here so only the bin counts and summary stats reach the plot task.
+                report_tasks.append((
+                    "✓ SAP score distribution histogram",
+                    "plot_sap_score_distribution", (ReportGenerator.summarize_sap_scores(sap_scores),), {},
+                    "Could not generate SAP score chart",
+                ))
         except Exception as e:
             console.print(f"[yellow]⚠ Could not generate SAP score chart: {e}[/yellow]")
 
     # 3. Scenario Comparison
     if scenario_results and len(scenario_results) > 0:
-        try:
-            generator.plot_scenario_comparison(scenario_results)
-            reports_created.append("✓ Scenario comparison charts")
-        except Exception as e:
-            console.print(f"[yellow]⚠ Could not generate scenario comparison: {e}[/yellow]")
+        report_tasks.append((
+            "✓ Scenario comparison charts",
+            "plot_scenario_comparison", (scenario_results,), {},
+            "Could not generate scenario comparison",
+        ))
 
     # 4. Subsidy Sensitivity Analysis
     if subsidy_results and len(subsidy_results) > 0:
-        try:
-            generator.plot_subsidy_sensitivity(subsidy_results)
-            reports_created.append("✓ Subsidy sensitivity analysis")
-        except Exception as e:
-            console.print(f"[yellow]⚠ Could not generate subsidy chart: {e}[/yellow]")
+        report_tasks.append((
+            "✓ Subsidy sensitivity analysis",
+            "plot_subsidy_sensitivity", (subsidy_results,), {},
+            "Could not generate subsidy chart",
+        ))
 
     # 5. Text and Markdown Summary Reports
     if archetype_results and scenario_results:
-        try:
-            # Use real pathway summary from spatial analysis if available
-            import pandas as pd
-
-            if pathway_summary is not None and len(pathway_summary) > 0:
-                # Use actual spatial analysis results
-                tier_summary = pathway_summary
-                console.print("[cyan]Using real heat network tier data from spatial analysis[/cyan]")
-            else:
-                # Fallback: placeholder tier summary (if spatial analysis was skipped)
-                tier_summary = pd.DataFrame({
-                    'Tier': ['Tier 5 (All properties - spatial analysis not run)'],
-                    'Property Count': [len(df_validated) if df_validated is not None else 0],
-                    'Percentage': [100.0],
-                    'Recommended Pathway': ['Heat Pump (default recommendation)']
-                })
-
-            generator.generate_summary_report(archetype_results, scenario_results, tier_summary)
-            reports_created.append("✓ Executive summary report (text)")
-            generator.generate_markdown_summary(archetype_results, scenario_results, tier_summary)
-            reports_created.append("✓ Executive summary report (Markdown)")
-        except Exception as e:
-            console.print(f"[yellow]⚠ Could not generate summary report: {e}[/yellow]")
+        # Use real pathway summary from spatial analysis if available
+        if pathway_summary is not None and len(pathway_summary) > 0:
+            # Use actual spatial analysis results
+            tier_summary = pathway_summary
+            console.print("[cyan]Using real heat network tier data from spatial analysis[/cyan]")
+        else:
+            # Fallback: placeholder tier summary (if spatial analysis was skipped)
+            tier_summary = pd.DataFrame.from_records(
+                [(
+                    'Tier 5 (All properties - spatial analysis not run)',
+                    len(df_validated) if df_validated is not None else 0,
+                    100.0,
+                    'Heat Pump (default recommendation)',
+                )],
+                columns=['Tier', 'Property Count', 'Percentage', 'Recommended Pathway'],
+            )
+        report_tasks.append((
+            "✓ Executive summary report (text)",
+            "generate_summary_report", (archetype_results, scenario_results, tier_summary), {},
+            "Could not generate text summary report",
+        ))
+        report_tasks.append((
+            "✓ Executive summary report (Markdown)",
+            "generate_markdown_summary", (archetype_results, scenario_results, tier_summary), {},
+            "Could not generate Markdown summary report",
+        ))
 
     # 6. Excel Export
     if archetype_results and scenario_results:
-        try:
-            generator.export_to_excel(
-                archetype_results=archetype_results,
-                scenario_results=scenario_results,
-                subsidy_results=subsidy_results,
-                df_properties=df_validated
-            )
-            reports_created.append("✓ Excel workbook with all results")
-        except Exception as e:
-            console.print(f"[yellow]⚠ Could not generate Excel export: {e}[/yellow]")
+        report_tasks.append((
+            "✓ Excel workbook with all results",
+            "export_to_excel",
+            (),
+            {
+                "archetype_results": archetype_results,
+                "scenario_results": scenario_results,
+                "subsidy_results": subsidy_results,
+                # The workbook only carries a property sample; slice before
+                # handing the frame to a worker process.
+                "df_properties": df_validated.head(1000) if df_validated is not None else None,
+            },
+            "Could not generate Excel export",
+        ))
+
+    # The ReportGenerator is only built once there is at least one task to run.
+    reports_created = _run_report_tasks(report_tasks)
 
     console.print()
     console.print(f"[green]✓[/green] Report generation complete!")
@@ -3199,9 +3367,7 @@ def generate_reports(
 
 def generate_one_stop_report(df=None, analysis_logger: AnalysisLogger = None, ui=None):
     """Generate the one-stop JSON report."""
-    console.print()
-    console.print(Panel("[bold]Phase 5: One-Stop Report[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 5: One-Stop Report")
     console.print("[cyan]Generating one-stop JSON report...[/cyan]")
     _ui_phase_started(ui, "One-Stop Report", "Generating one-stop JSON report")
 
@@ -3283,8 +3449,6 @@ def cleanup_reporting_outputs():
     Returns:
         Path to the archive directory, or None if nothing was moved.
     """
-    from datetime import datetime
-
     outputs_dir = Path(DATA_OUTPUTS_DIR)
 
     preserved_files = {
@@ -3365,9 +3529,7 @@ def cleanup_reporting_outputs():
 
 def generate_additional_reports(df_raw, df_validated, validation_report, archetype_results, scenario_results, analysis_logger: AnalysisLogger = None, ui=None):
     """Generate additional specialized reports for client presentation."""
-    console.print()
-    console.print(Panel("[bold]Phase 5.5: Additional Reports[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 5.5: Additional Reports")
     _ui_phase_started(ui, "Additional Reports", "Generating supporting report tables")
 
     if analysis_logger:
@@ -3377,7 +3539,6 @@ def generate_additional_reports(df_raw, df_validated, validation_report, archety
         )
 
     from src.analysis.additional_reports import AdditionalReports
-    from pathlib import Path
 
     reporter = AdditionalReports()
     reports_created = []
@@ -3518,6 +3679,20 @@ def generate_additional_reports(df_raw, df_validated, validation_report, archety
     }
 
 
+def _read_sidecar_csvs(paths: Dict[str, Path]) -> Dict[str, Any]:
+    """Read small output CSVs concurrently; failures are returned in place of frames."""
+    def _read(path):
+        try:
+            return pd.read_csv(path)
+        except Exception as e:
+            return e
+
+    if len(paths) <= 1:
+        return {name: _read(path) for name, path in paths.items()}
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return dict(zip(paths, executor.map(_read, paths.values())))
+
+
 def package_dashboard_assets(
     archetype_results,
     scenario_results,
@@ -3546,9 +3721,7 @@ def package_dashboard_assets(
     11. Tenure Filtering
     12. Documentation & Tests
     """
-    console.print()
-    console.print(Panel("[bold]Phase 6: Dashboard Packaging[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 6: Dashboard Packaging")
     _ui_phase_started(ui, "Dashboard Packaging", "Exporting dashboard dataset")
 
     if analysis_logger:
@@ -3559,7 +3732,6 @@ def package_dashboard_assets(
 
     try:
         from src.reporting.dashboard_data_builder import DashboardDataBuilder
-        import pandas as pd
 
         builder = DashboardDataBuilder(output_dir=Path(DATA_OUTPUTS_DIR))
         case_summary = (additional_reports or {}).get("case_street_summary") if additional_reports else None
@@ -3570,56 +3742,61 @@ def package_dashboard_assets(
         heat_network_thresholds = (additional_reports or {}).get("heat_network_thresholds") if additional_reports else None
 
         # Load additional data files if they exist
-        load_profile_summary = None
-        tipping_point_curve = None
-        retrofit_packages_summary = None
-        hn_vs_hp_comparison = None
-
         outputs_dir = Path(DATA_OUTPUTS_DIR)
 
-        # Load load profiles summary (Section 9)
-        load_profiles_file = outputs_dir / "pathway_load_profile_summary.csv"
-        if load_profiles_file.exists():
-            try:
-                load_profile_summary = pd.read_csv(load_profiles_file)
-                console.print(f"[green]✓[/green] Loaded load profile summary")
-            except Exception as e:
-                logger.debug(f"Could not load load profiles: {e}")
-
-        # Load tipping point curve (Section 8)
-        tipping_point_file = outputs_dir / "fabric_tipping_point_curve.csv"
-        from config.config import get_scenario_policy
-        if tipping_point_file.exists() and 'fabric_to_tipping_point' in get_scenario_policy()['publish']:
-            try:
-                tipping_point_curve = pd.read_csv(tipping_point_file)
-                console.print(f"[green]✓[/green] Loaded fabric tipping point curve")
-            except Exception as e:
-                logger.debug(f"Could not load tipping point curve: {e}")
-
-        # Load retrofit packages summary (Section 2, 3, 5)
-        retrofit_packages_file = outputs_dir / "retrofit_packages_summary.csv"
-        if retrofit_packages_file.exists():
-            try:
-                retrofit_packages_summary = pd.read_csv(retrofit_packages_file)
-                console.print(f"[green]✓[/green] Loaded retrofit packages summary")
-            except Exception as e:
-                logger.debug(f"Could not load retrofit packages: {e}")
+        # name -> (path, success label, failure label, whether this run wants it)
+        sidecar_specs = {
+            # Section 9
+            "load_profile_summary": (
+                outputs_dir / "pathway_load_profile_summary.csv",
+                "load profile summary", "load profiles", True,
+            ),
+            # Section 8
+            "tipping_point_curve": (
+                outputs_dir / "fabric_tipping_point_curve.csv",
+                "fabric tipping point curve", "tipping point curve",
+                'fabric_to_tipping_point' in get_scenario_policy()['publish'],
+            ),
+            # Sections 2, 3, 5
+            "retrofit_packages_summary": (
+                outputs_dir / "retrofit_packages_summary.csv",
+                "retrofit packages summary", "retrofit packages", True,
+            ),
+            "hn_vs_hp_comparison": (
+                outputs_dir / "stock_scenario_comparison.csv",
+                "HP vs HN comparison", "HP vs HN comparison", True,
+            ),
+            "heat_network_thresholds": (
+                outputs_dir / "heat_network_connection_thresholds.csv",
+                "heat network connection thresholds", "heat network thresholds",
+                heat_network_thresholds is None,
+            ),
+        }
+        sidecar_paths = {
+            name: path
+            for name, (path, _, _, wanted) in sidecar_specs.items()
+            if wanted and path.exists()
+        }
+        sidecars = _read_sidecar_csvs(sidecar_paths)
+        for name, (_, loaded_label, failed_label, _) in sidecar_specs.items():
+            if name not in sidecars:
+                continue
+            result = sidecars[name]
+            if isinstance(result, Exception):
+                logger.debug(f"Could not load {failed_label}: {result}")
+            else:
+                console.print(f"[green]✓[/green] Loaded {loaded_label}")
 
-        comparison_file = outputs_dir / "stock_scenario_comparison.csv"
-        if comparison_file.exists():
-            try:
-                hn_vs_hp_comparison = pd.read_csv(comparison_file)
-                console.print(f"[green]✓[/green] Loaded HP vs HN comparison")
-            except Exception as e:
-                logger.debug(f"Could not load HP vs HN comparison: {e}")
+        def _sidecar_frame(name):
+            result = sidecars.get(name)
+            return None if isinstance(result, Exception) else result
 
-        threshold_file = outputs_dir / "heat_network_connection_thresholds.csv"
-        if heat_network_thresholds is None and threshold_file.exists():
-            try:
-                heat_network_thresholds = pd.read_csv(threshold_file)
-                console.print(f"[green]✓[/green] Loaded heat network connection thresholds")
-            except Exception as e:
-                logger.debug(f"Could not load heat network thresholds: {e}")
+        load_profile_summary = _sidecar_frame("load_profile_summary")
+        tipping_point_curve = _sidecar_frame("tipping_point_curve")
+        retrofit_packages_summary = _sidecar_frame("retrofit_packages_summary")
+        hn_vs_hp_comparison = _sidecar_frame("hn_vs_hp_comparison")
+        if heat_network_thresholds is None:
+            heat_network_thresholds = _sidecar_frame("heat_network_thresholds")
 
         dataset = builder.build_dataset(
             archetype_results,
@@ -3687,7 +3864,6 @@ def _describe_existing_file(file_path: Path, title: str, include_records: bool =
     try:
         file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
         mod_time = os.path.getmtime(file_path)
-        from datetime import datetime
         mod_date = datetime.fromtimestamp(mod_time).strftime('%Y-%m-%d %H:%M')
 
         record_line = ""
@@ -3696,7 +3872,7 @@ def _describe_existing_file(file_path: Path, title: str, include_records: bool =
                 if file_path.suffix.lower() == ".parquet":
                     record_count = parquet_row_count(file_path)
                 else:
-                    record_count = max(sum(1 for _ in open(file_path, encoding="utf-8")) - 1, 0)
+                    record_count = count_csv_records(file_path)
                 record_line = f"Records: ~{record_count:,}\n"
             except Exception as e:
                 logger.debug(f"Could not count records in {file_path}: {e}")
@@ -3775,8 +3951,6 @@ def prompt_use_existing_dataframe(
     _ui_phase_started(ui, phase_name, f"Loading existing {description}")
 
     try:
-        import pandas as pd
-
         if selected_path.suffix.lower() == ".parquet":
             df_existing = pd.read_parquet(selected_path)
             output_type = "parquet"
@@ -3832,14 +4006,11 @@ def check_existing_data(sample_start_date: date_cls = None, sample_end_date: dat
     if raw_csv.exists() or filtered_csv.exists():
         # Get file info
         if filtered_csv.exists() and _matches(filtered_csv):
-            import os
             file_size = os.path.getsize(filtered_csv) / (1024 * 1024)  # MB
             mod_time = os.path.getmtime(filtered_csv)
-            from datetime import datetime
             mod_date = datetime.fromtimestamp(mod_time).strftime('%Y-%m-%d %H:%M')
 
-            # Quick count of records
-            import pandas as pd
+            # Confirm the stock-definition columns are present
             try:
                 header_df = pd.read_csv(filtered_csv, nrows=0)
                 missing_columns = EPCAPIDownloader.get_missing_stock_definition_columns(header_df)
@@ -3855,29 +4026,28 @@ def check_existing_data(sample_start_date: date_cls = None, sample_end_date: dat
                     ))
                     console.print()
                     return False, None, 0
-                line_count = sum(1 for _ in open(filtered_csv)) - 1  # Subtract header
 
+                # The record count is reported by load_existing_data once the
+                # user has chosen to reuse the file; counting here would scan
+                # the whole CSV just to render this panel.
                 console.print()
                 console.print(Panel(
                     f"[bold cyan]Existing Data Found[/bold cyan]\n\n"
                     f"File: epc_london_filtered.csv\n"
                     f"Size: {file_size:.1f} MB\n"
-                    f"Records: ~{line_count:,} London pre-1930 terraced house records\n"
                     f"Last modified: {mod_date}",
                     border_style="green"
                 ))
                 console.print()
 
-                return True, filtered_csv, line_count
+                return True, filtered_csv, None
             except Exception as e:
                 logger.debug(f"Could not read existing data: {e}")
                 return False, None, 0
 
         elif raw_csv.exists() and _matches(raw_csv):
-            import os
             file_size = os.path.getsize(raw_csv) / (1024 * 1024)
             mod_time = os.path.getmtime(raw_csv)
-            from datetime import datetime
             mod_date = datetime.fromtimestamp(mod_time).strftime('%Y-%m-%d %H:%M')
 
             console.print()
@@ -3932,20 +4102,110 @@ def resolve_one_stop_only(config: Optional[Dict[str, Any]], args: argparse.Names
 
 
 def open_results_folder() -> None:
-    """Open the outputs folder with the platform file manager."""
-    if platform.system() == 'Windows':
-        subprocess.run(['explorer', 'data\\outputs'], check=False)
-    elif platform.system() == 'Darwin':
-        subprocess.run(['open', 'data/outputs'], check=False)
-    else:
-        subprocess.run(['xdg-open', 'data/outputs'], check=False)
+    """Open the outputs folder with the platform file manager without waiting for it."""
+    system = platform.system()
+    if system == 'Windows':
+        os.startfile('data\\outputs')
+        return
+    opener = 'open' if system == 'Darwin' else 'xdg-open'
+    subprocess.Popen(
+        [opener, 'data/outputs'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        start_new_session=True,
+    )
+
+
+# pandas' default missing-value tokens, so the Arrow reader nulls the same
+# cells pd.read_csv would and validation drops the same rows either way.
+PANDAS_DEFAULT_NA_VALUES = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+)
+
+
+def _read_existing_csv(file_path: Path) -> pd.DataFrame:
+    """Parse a saved EPC CSV with the multithreaded Arrow reader, falling back to pandas' C parser."""
+    try:
+        read_options = pacsv.ReadOptions(use_threads=True, block_size=16 << 20)
+        convert_options = pacsv.ConvertOptions(
+            null_values=list(PANDAS_DEFAULT_NA_VALUES),
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True,
+        )
+        # Arrow would infer ISO dates as date32/timestamp, and casting those back
+        # rewrites the text (e.g. drops the "T"). Read the columns it would treat
+        # as temporal as plain strings instead, exactly as pandas' parser does.
+        with pacsv.open_csv(file_path, read_options=read_options, convert_options=convert_options) as reader:
+            temporal_columns = [
+                field.name
+                for field in reader.schema
+                if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type) or pa.types.is_time(field.type)
+            ]
+        convert_options.column_types = {column: pa.string() for column in temporal_columns}
+        table = pacsv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        # Arrow hands back null strings as None; pandas' parser uses NaN.
+        for col in df.select_dtypes(include=['object']).columns:
+            values = df[col]
+            df[col] = values.where(values.notna(), np.nan)
+        return df
+    except Exception as e:
+        logger.debug(f"Arrow CSV reader failed for {file_path.name}; using pandas parser: {e}")
+        return pd.read_csv(file_path)
+
+
+def _csv_snapshot_path(csv_path: Path) -> Path:
+    """Return the Parquet snapshot path cached alongside a saved CSV."""
+    return csv_path.with_name(f"{csv_path.stem}.snapshot.parquet")
+
+
+# Bump whenever _read_existing_csv changes what it returns, so snapshots
+# written by an older reader are rebuilt rather than reused.
+CSV_SNAPSHOT_READER_VERSION = 3
+
+
+def _csv_snapshot_key(csv_path: Path) -> str:
+    stat = csv_path.stat()
+    return f"v{CSV_SNAPSHOT_READER_VERSION}:{csv_path.name}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _read_existing_dataset(file_path: Path) -> pd.DataFrame:
+    """
+    Load a saved EPC CSV, reusing a Parquet snapshot while the CSV is unchanged.
+
+    The snapshot records the reader version and the CSV's (name, size, mtime)
+    in its schema metadata, so a rewrite of the CSV or a change to the reader
+    invalidates it and the CSV is parsed again.
+    """
+    snapshot_path = _csv_snapshot_path(file_path)
+    source_key = _csv_snapshot_key(file_path)
+    if snapshot_path.is_file():
+        try:
+            metadata = pq.read_schema(snapshot_path).metadata or {}
+            if metadata.get(b"heatstreet_source_key") == source_key.encode("utf-8"):
+                return pd.read_parquet(snapshot_path, engine="pyarrow")
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable CSV snapshot {snapshot_path}: {e}")
+
+    df = _read_existing_csv(file_path)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            b"heatstreet_source_key": source_key.encode("utf-8"),
+        })
+        pq.write_table(table, snapshot_path, compression="zstd", row_group_size=256_000)
+    except Exception as e:
+        logger.warning(f"Could not write Parquet snapshot for {file_path.name}: {e}")
+    return df
 
 
 def load_existing_data(file_path, analysis_logger: AnalysisLogger = None, ui=None):
     """Load previously downloaded data from file."""
-    console.print()
-    console.print(Panel("[bold]Phase 1: Loading Existing Data[/bold]", border_style="blue"))
-    console.print()
+    _print_phase_banner("Phase 1: Loading Existing Data")
     _ui_phase_started(ui, "Loading Existing Data", "Loading previously downloaded EPC data")
 
     if analysis_logger:
@@ -3961,8 +4221,7 @@ def load_existing_data(file_path, analysis_logger: AnalysisLogger = None, ui=Non
     )
     console.print(f"[cyan]Loading {dataset_label} from {file_path.name}...[/cyan]")
 
-    import pandas as pd
-    df = pd.read_csv(file_path)
+    df = _read_existing_dataset(file_path)
 
     console.print(f"[green]✓[/green] Loaded {len(df):,} records")
 
@@ -4020,7 +4279,6 @@ def main(argv=None):
 
 def _run_with_textual_main(args: argparse.Namespace, ui) -> int:
     """Keep one Textual process open across clean, isolated analysis sessions."""
-    import threading
     from src.ui.textual_app import HeatStreetStudioApp
 
     result: Dict[str, Any] = {"exit_code": EXIT_SUCCESS}
@@ -4271,8 +4529,6 @@ def _main_impl(
     fixture_validation_report = None
     fixture_frame = None
     if fixture_mode:
-        import pandas as pd
-
         fixture_path = Path(args.development_fixture)
         if not fixture_path.is_file():
             raise FileNotFoundError(f"Development fixture not found: {fixture_path}")
@@ -4406,6 +4662,8 @@ def _main_impl(
                 sample_end_date=sample_end_date,
                 download_scope=args.download_scope,
                 borough=args.borough,
+                fresh=args.fresh,
+                use_existing=args.use_existing,
                 ui=ui,
             )
         except AnalysisCancelled as e:
@@ -4423,7 +4681,10 @@ def _main_impl(
         console.print("[cyan]Proceeding with existing data...[/cyan]")
         console.print()
 
-    df_raw = df if is_dataset_reference(df) else df.copy()
+    # Validation only renames/adds columns on its input before filtering into new
+    # frames, so a shallow copy keeps the pre-validation view without duplicating
+    # the column data.
+    df_raw = df if is_dataset_reference(df) else df.copy(deep=False)
 
     # Phase 2: Check for existing validated data before running validation
     # If we just downloaded fresh data, force re-validation instead of using old validated data
@@ -4621,7 +4882,6 @@ def _main_impl(
             ("client_scenarios", Path(DATA_OUTPUTS_DIR) / "scenario_results_summary.csv", "client"),
         ],
     )
-    from config.config import get_scenario_policy
     published_scenarios = set(get_scenario_policy()["publish"])
     client_scenario_results = {
         scenario_id: result
@@ -4820,7 +5080,11 @@ def _main_impl(
         dashboard_public = REPO_ROOT / "dashboard" / "public" / "dashboard-data.json"
         dashboard_temp = dashboard_public.with_suffix(".json.publish-tmp")
         dashboard_temp.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(dashboard_candidate, dashboard_temp)
+        # Always write a distinct file: a hardlink would let a later in-place
+        # rewrite of the run candidate leak into the published dashboard.
+        with open(dashboard_candidate, "rb") as source, open(dashboard_temp, "wb") as target:
+            shutil.copyfileobj(source, target, length=4 * 1024 * 1024)
+        shutil.copystat(dashboard_candidate, dashboard_temp)
         os.replace(dashboard_temp, dashboard_public)
         console.print(f"[green]OK[/green] Published validated run to: {_public_outputs_dir}")
     elif _active_run_context is not None:
@@ -5,27 +5,39 @@ Downloads EPC data from the Energy Certificate Data API.
 Supports both interactive borough search downloads and bulk full-load downloads.
 """
 
+import argparse
 import csv
 from dataclasses import dataclass
+import gzip
+import hashlib
 import io
 import json
 import os
 import ssl
 import tempfile
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date as date_cls, datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 from loguru import logger
 from tqdm import tqdm
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from config.config import DATA_RAW_DIR, get_property_filters, load_config
@@ -44,9 +56,75 @@ from src.utils.staged_dataset import (
     write_dataset_manifest,
     write_parquet_part,
 )
+from src.utils.profiling import get_max_inflight_requests, get_request_rate_limit
 
 load_dotenv()
 
+# Shared by every downloader and thread so concurrent borough downloads never
+# exceed HEATSTREET_MAX_INFLIGHT open requests against the EPC API.
+_INFLIGHT_REQUESTS = threading.BoundedSemaphore(get_max_inflight_requests())
+
+
+class _RequestRateLimiter:
+    """
+    Token bucket shared by every EPC API request thread.
+
+    ``rate`` tokens are added per second up to ``capacity``; a rate of 0 leaves
+    requests unpaced. ``pause`` holds every caller back until a server-requested
+    wait (Retry-After, exhausted quota) has elapsed, so one throttled thread
+    does not leave the others hammering the API.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._resume_at - now
+                if wait <= 0:
+                    if self.rate <= 0:
+                        return
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+_REQUEST_RATE_LIMITER = _RequestRateLimiter(get_request_rate_limit())
+
+
+def _loads_json_bytes(body: bytes):
+    """Parse a UTF-8 JSON response body without decoding it to str first."""
+    if _ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Parse a delta-seconds Retry-After header; HTTP-date values are ignored."""
+    value = headers.get("Retry-After") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
 
 class _ManualRedirectHandler(urllib.request.HTTPRedirectHandler):
     """Disable automatic redirects so download auth can be stripped explicitly."""
@@ -185,9 +263,12 @@ class EPCAPIDownloader:
     SEARCH_URL = f"{BASE_URL}/api/domestic/search"
     FULL_LOAD_URL = f"{BASE_URL}/api/files/domestic/csv"
     DEFAULT_PAGE_SIZE = 5000
+    # Rate limiting and transient server-side failures worth retrying in place.
+    RETRYABLE_HTTP_STATUSES = frozenset({429, 500, 502, 503, 504})
     FULL_LOAD_CHUNK_SIZE = 100_000
     REDIRECT_STATUS_CODES = (301, 302, 303, 307, 308)
     MAX_DOWNLOAD_REDIRECTS = 10
+    SEARCH_CACHE_TTL_DAYS = 30
     STOCK_DEFINITION_COLUMNS = (
         "PROPERTY_TYPE",
         "BUILT_FORM",
@@ -213,6 +294,38 @@ class EPCAPIDownloader:
         "LOCAL_AUTHORITY_LABEL",
         "LOCAL_AUTHORITY",
     )
+    API_FIELD_RENAMES = {
+        "certificateNumber": "CERTIFICATE_NUMBER",
+        "addressLine1": "ADDRESS_LINE1",
+        "addressLine2": "ADDRESS_LINE2",
+        "addressLine3": "ADDRESS_LINE3",
+        "addressLine4": "ADDRESS_LINE4",
+        "postcode": "POSTCODE",
+        "postTown": "POST_TOWN",
+        "council": "COUNCIL",
+        "constituency": "CONSTITUENCY",
+        "currentEnergyEfficiencyBand": "CURRENT_ENERGY_RATING",
+        "currentEnergyEfficiencyRating": "CURRENT_ENERGY_RATING",
+        "registrationDate": "LODGEMENT_DATE",
+        "lodgementDate": "LODGEMENT_DATE",
+        "inspectionDate": "INSPECTION_DATE",
+        "uprn": "UPRN",
+        "propertyType": "PROPERTY_TYPE",
+        "builtForm": "BUILT_FORM",
+        "constructionAgeBand": "CONSTRUCTION_AGE_BAND",
+        "propertyTypeDescription": "PROPERTY_TYPE",
+    }
+    # Descriptive columns read as nullable text from the full-load CSV, so pandas
+    # skips type inference for them, every chunk/Parquet part agrees on the type,
+    # and blanks are written to the staged parts as nulls rather than "nan".
+    FULL_LOAD_TEXT_COLUMNS = (
+        *STOCK_DEFINITION_COLUMNS,
+        *BOROUGH_COLUMN_CANDIDATES,
+        "CURRENT_ENERGY_RATING",
+        "POTENTIAL_ENERGY_RATING",
+        "POSTCODE",
+        "TENURE",
+    )
 
     @staticmethod
     def _emit_progress(progress_callback: Optional[Callable[[Dict[str, Any]], None]], event: Dict[str, Any]) -> None:
@@ -260,7 +373,13 @@ class EPCAPIDownloader:
         'Westminster': 'E09000033'
     }
 
-    def __init__(self, token: Optional[str] = None, download_mode: str = "search", timeout: int = 60):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        download_mode: str = "search",
+        timeout: int = 60,
+        use_search_cache: bool = False,
+    ):
         self.config = load_config()
         self.property_filters = get_property_filters()
         self.token = token or os.getenv("EPC_API_TOKEN")
@@ -268,8 +387,10 @@ class EPCAPIDownloader:
             raise ValueError("API token not found. Please set EPC_API_TOKEN in your .env file or pass it as a parameter.")
         self.download_mode = download_mode
         self.timeout = timeout
+        self.use_search_cache = use_search_cache
         self._full_load_cache: Optional[pd.DataFrame] = None
         self._full_load_stage_cache: Optional[DatasetReference] = None
+        self._ssl_context: Optional[ssl.SSLContext] = None
         DATA_RAW_DIR.mkdir(parents=True, exist_ok=True)
         logger.info(f"Initialized EPC API Downloader using {self.download_mode} mode")
 
@@ -289,6 +410,12 @@ class EPCAPIDownloader:
 
         return ssl.create_default_context(cafile=certifi.where())
 
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        """Return this downloader's TLS context, loading the CA bundle on first use only."""
+        if self._ssl_context is None:
+            self._ssl_context = self._create_ssl_context()
+        return self._ssl_context
+
     @classmethod
     def _is_first_party_api_url(cls, url: str) -> bool:
         return urllib.parse.urlparse(url).netloc.casefold() == cls.API_HOST
@@ -326,7 +453,7 @@ class EPCAPIDownloader:
     ):
         opener = urllib.request.build_opener(
             _ManualRedirectHandler(),
-            urllib.request.HTTPSHandler(context=self._create_ssl_context()),
+            urllib.request.HTTPSHandler(context=self._get_ssl_context()),
         )
         current_url = url
 
@@ -401,50 +528,74 @@ class EPCAPIDownloader:
     ) -> Dict:
         query = urllib.parse.urlencode(params, doseq=True)
         full_url = f"{url}?{query}" if query else url
-        request = urllib.request.Request(full_url, headers=self._headers())
+        # Search pages are JSON text, so ask for them compressed.
+        request = urllib.request.Request(full_url, headers={**self._headers(), "Accept-Encoding": "gzip"})
         backoff = 1.0
         for attempt in range(retries):
+            _REQUEST_RATE_LIMITER.acquire()
             try:
-                try:
-                    response_context = self._create_ssl_context()
-                    response = urllib.request.urlopen(
-                        request,
-                        timeout=self.timeout,
-                        context=response_context,
-                    )
-                except TypeError:
-                    response = urllib.request.urlopen(request, timeout=self.timeout)
-
-                with response:
-                    payload = response.read().decode("utf-8")
-                    if not payload.strip():
+                with _INFLIGHT_REQUESTS:
+                    try:
+                        response_context = self._get_ssl_context()
+                        response = urllib.request.urlopen(
+                            request,
+                            timeout=self.timeout,
+                            context=response_context,
+                        )
+                    except TypeError:
+                        response = urllib.request.urlopen(request, timeout=self.timeout)
+
+                    with response:
+                        body = response.read()
+                        headers = getattr(response, "headers", None)
+                    if headers is not None and str(headers.get("Content-Encoding", "")).strip().lower() == "gzip":
+                        body = gzip.decompress(body)
+                    # Quota spent: hold every thread back before the next call
+                    # instead of waiting for it to come back as a 429.
+                    if headers is not None and str(headers.get("X-RateLimit-Remaining", "")).strip() == "0":
+                        _REQUEST_RATE_LIMITER.pause(_retry_after_seconds(headers) or 1.0)
+                    if not body.strip():
                         if request_context is None:
                             return {}
                         raise EPCDownloadError.empty_response(
                             request_context,
                             detail="EPC API returned an empty JSON response body.",
                         )
-                    return json.loads(payload) if payload else {}
+                    return _loads_json_bytes(body)
             except urllib.error.HTTPError as e:
-                if e.code == 429 and attempt < retries - 1:
-                    retry_after = e.headers.get("Retry-After")
-                    sleep_for = float(retry_after) if retry_after and retry_after.isdigit() else backoff
-                    logger.warning(f"Rate limited by EPC API; retrying in {sleep_for:.1f}s")
-                    time.sleep(sleep_for)
+                if e.code in self.RETRYABLE_HTTP_STATUSES and attempt < retries - 1:
+                    retry_after = _retry_after_seconds(e.headers)
+                    sleep_for = retry_after if retry_after is not None else backoff
+                    if e.code == 429:
+                        logger.warning(f"Rate limited by EPC API; retrying in {sleep_for:.1f}s")
+                    else:
+                        logger.warning(f"EPC API returned HTTP {e.code}; retrying in {sleep_for:.1f}s")
+                    # The pause is shared, so sibling borough threads back off too.
+                    _REQUEST_RATE_LIMITER.pause(sleep_for)
                     backoff = min(backoff * 2, 60)
                     continue
                 if request_context is not None:
                     raise EPCDownloadError.from_http_error(request_context, e) from e
                 raise
-            except urllib.error.URLError as e:
+            except (TimeoutError, urllib.error.URLError) as e:
+                timed_out = isinstance(e, TimeoutError) or isinstance(
+                    getattr(e, "reason", None), TimeoutError
+                )
+                if timed_out and attempt < retries - 1:
+                    # Retry the same page so the borough keeps the pages it already has.
+                    logger.warning(f"EPC API request timed out; retrying in {backoff:.1f}s")
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, 60)
+                    continue
                 if request_context is not None:
-                    raise EPCDownloadError.from_url_error(request_context, e) from e
+                    url_error = e if isinstance(e, urllib.error.URLError) else urllib.error.URLError(e)
+                    raise EPCDownloadError.from_url_error(request_context, url_error) from e
                 raise
             except ssl.SSLError as e:
                 if request_context is not None:
                     raise EPCDownloadError.unexpected(request_context, e) from e
                 raise
-            except json.JSONDecodeError as e:
+            except (json.JSONDecodeError, gzip.BadGzipFile) as e:
                 if request_context is not None:
                     raise EPCDownloadError.unexpected(request_context, e) from e
                 raise
@@ -532,28 +683,7 @@ class EPCAPIDownloader:
     def _normalize_api_records(self, df: pd.DataFrame, borough_name: Optional[str] = None) -> pd.DataFrame:
         if df.empty:
             return df
-        rename_map = {
-            "certificateNumber": "CERTIFICATE_NUMBER",
-            "addressLine1": "ADDRESS_LINE1",
-            "addressLine2": "ADDRESS_LINE2",
-            "addressLine3": "ADDRESS_LINE3",
-            "addressLine4": "ADDRESS_LINE4",
-            "postcode": "POSTCODE",
-            "postTown": "POST_TOWN",
-            "council": "COUNCIL",
-            "constituency": "CONSTITUENCY",
-            "currentEnergyEfficiencyBand": "CURRENT_ENERGY_RATING",
-            "currentEnergyEfficiencyRating": "CURRENT_ENERGY_RATING",
-            "registrationDate": "LODGEMENT_DATE",
-            "lodgementDate": "LODGEMENT_DATE",
-            "inspectionDate": "INSPECTION_DATE",
-            "uprn": "UPRN",
-            "propertyType": "PROPERTY_TYPE",
-            "builtForm": "BUILT_FORM",
-            "constructionAgeBand": "CONSTRUCTION_AGE_BAND",
-            "propertyTypeDescription": "PROPERTY_TYPE",
-        }
-        df = df.rename(columns={c: rename_map.get(c, c) for c in df.columns})
+        df = df.rename(columns={c: self.API_FIELD_RENAMES.get(c, c) for c in df.columns})
         df.columns = [c.replace("-", "_").upper() for c in df.columns]
         if df.columns.duplicated().any():
             df = df.loc[:, ~df.columns.duplicated()].copy()
@@ -613,13 +743,7 @@ class EPCAPIDownloader:
                 "column was found."
             )
         tokens = cls._borough_tokens(borough_names)
-        mask = (
-            df[borough_column]
-            .astype(str)
-            .str.strip()
-            .str.casefold()
-            .isin(tokens)
-        )
+        mask = cls._text_isin_mask(df[borough_column], tokens)
         return df.loc[mask].copy()
 
     @classmethod
@@ -641,17 +765,11 @@ class EPCAPIDownloader:
                 "PROPERTY_TYPE is missing."
             )
         requested_types = {
-            str(property_type).strip().casefold()
+            str(property_type).strip()
             for property_type in property_types
             if property_type is not None
         }
-        mask = (
-            df[property_column]
-            .astype(str)
-            .str.strip()
-            .str.casefold()
-            .isin(requested_types)
-        )
+        mask = cls._text_isin_mask(df[property_column], requested_types)
         return df.loc[mask].copy()
 
     @staticmethod
@@ -684,6 +802,21 @@ class EPCAPIDownloader:
         end_year = sample_end_date.year if sample_end_date else member_year
         return start_year <= member_year <= end_year
 
+    @classmethod
+    def _full_load_text_dtypes(cls, zf: zipfile.ZipFile, member_name: str) -> Dict[str, str]:
+        """Map the member's raw header names for FULL_LOAD_TEXT_COLUMNS to the string dtype."""
+        with zf.open(member_name) as raw_file:
+            header = pd.read_csv(raw_file, nrows=0).columns
+        text_columns = set(cls.FULL_LOAD_TEXT_COLUMNS)
+        return {
+            raw: "string"
+            for raw, normalized in zip(
+                header,
+                cls._normalize_column_labels(cls.API_FIELD_RENAMES.get(c, c) for c in header),
+            )
+            if normalized in text_columns
+        }
+
     @staticmethod
     def _count_member_data_lines(zf: zipfile.ZipFile, member_name: str) -> int:
         """Approximate the number of data rows in a CSV member for audit logging."""
@@ -1030,11 +1163,13 @@ class EPCAPIDownloader:
                     },
                 )
 
+                text_dtypes = self._full_load_text_dtypes(zf, member)
                 with zf.open(member) as raw_file:
                     chunk_iter = pd.read_csv(
                         raw_file,
                         chunksize=chunk_size,
                         on_bad_lines="skip",
+                        dtype=text_dtypes,
                     )
                     for chunk in chunk_iter:
                         chunk_rows_read = len(chunk)
@@ -1361,6 +1496,52 @@ class EPCAPIDownloader:
         message = str(error).lower()
         return "page number" in message and "out of range" in message
 
+    def _search_cache_path(
+        self,
+        borough_name: str,
+        property_type: str,
+        from_year: int,
+        sample_start_date: Optional[date_cls],
+        sample_end_date: Optional[date_cls],
+        max_results: Optional[int],
+    ) -> Path:
+        key = "|".join(
+            str(part) for part in (
+                borough_name,
+                property_type,
+                from_year,
+                sample_start_date.isoformat() if sample_start_date else "",
+                sample_end_date.isoformat() if sample_end_date else "",
+                max_results or "",
+            )
+        )
+        return DATA_RAW_DIR / "_cache" / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.parquet"
+
+    def _read_search_cache(self, cache_path: Path) -> Optional[pd.DataFrame]:
+        """Return a cached borough search result if it exists and is within the TTL."""
+        if not cache_path.is_file():
+            return None
+        age_seconds = time.time() - cache_path.stat().st_mtime
+        if age_seconds > self.SEARCH_CACHE_TTL_DAYS * 86400:
+            logger.debug(f"Ignoring expired EPC search cache entry: {cache_path}")
+            return None
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable EPC search cache entry {cache_path}: {e}")
+            return None
+
+    @staticmethod
+    def _write_search_cache(cache_path: Path, df: pd.DataFrame) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".parquet.tmp")
+        try:
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Could not cache EPC search result at {cache_path}: {e}")
+
     def download_borough_data(
         self,
         borough_name: str,
@@ -1372,6 +1553,8 @@ class EPCAPIDownloader:
         log_borough: bool = True,
         show_progress: bool = True,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_bar: Optional[tqdm] = None,
+        use_search_cache: Optional[bool] = None,
     ) -> pd.DataFrame:
         if borough_name not in self.LONDON_LA_CODES:
             logger.error(f"Unknown borough: {borough_name}")
@@ -1401,11 +1584,34 @@ class EPCAPIDownloader:
                 request_context=request_context,
                 progress_callback=progress_callback,
             )
+        if use_search_cache is None:
+            use_search_cache = self.use_search_cache
+        cache_path = None
+        if use_search_cache:
+            cache_path = self._search_cache_path(
+                borough_name,
+                property_type,
+                from_year,
+                sample_start_date,
+                sample_end_date,
+                max_results,
+            )
+            cached = self._read_search_cache(cache_path)
+            if cached is not None:
+                logger.info(f"{borough_name}: reusing cached EPC search results ({len(cached):,} records)")
+                return cached
         all_records: List[pd.DataFrame] = []
         current_page = 1
         page_size = self.DEFAULT_PAGE_SIZE
         total_records = 0
-        pbar = tqdm(desc=f"{borough_name}", unit=" records", disable=not show_progress)
+        # A caller-supplied bar is shared across boroughs and closed by its owner.
+        owns_pbar = progress_bar is None
+        pbar = progress_bar if progress_bar is not None else tqdm(
+            desc=f"{borough_name}",
+            unit=" records",
+            disable=not show_progress,
+            mininterval=0.5,
+        )
         try:
             while True:
                 params = self._build_search_params(
@@ -1478,11 +1684,15 @@ class EPCAPIDownloader:
         except Exception as e:
             raise EPCDownloadError.unexpected(request_context, e) from e
         finally:
-            pbar.close()
+            if owns_pbar:
+                pbar.close()
         if not all_records:
             return pd.DataFrame()
         df = pd.concat(all_records, ignore_index=True)
-        return self._apply_sample_window_filter(df, sample_start_date, sample_end_date, borough_name)
+        df = self._apply_sample_window_filter(df, sample_start_date, sample_end_date, borough_name)
+        if cache_path is not None:
+            self._write_search_cache(cache_path, df)
+        return df
 
     def _download_borough_from_full_load(
         self,
@@ -1523,14 +1733,19 @@ class EPCAPIDownloader:
         if lodgement_col is None and inspection_col is None:
             logger.warning(f"{log_prefix}: no lodgement/inspection date columns found")
             return df
-        lodgement_dates = pd.to_datetime(df[lodgement_col], errors='coerce') if lodgement_col else pd.Series(pd.NaT, index=df.index)
-        inspection_dates = pd.to_datetime(df[inspection_col], errors='coerce') if inspection_col else pd.Series(pd.NaT, index=df.index)
+        # EPC dates are ISO formatted, so parse with the fixed-format fast path.
+        lodgement_dates = pd.to_datetime(df[lodgement_col], errors='coerce', format='ISO8601') if lodgement_col else pd.Series(pd.NaT, index=df.index)
+        inspection_dates = pd.to_datetime(df[inspection_col], errors='coerce', format='ISO8601') if inspection_col else pd.Series(pd.NaT, index=df.index)
         effective_dates = lodgement_dates.fillna(inspection_dates)
+        if getattr(effective_dates.dt, "tz", None) is not None:
+            effective_dates = effective_dates.dt.tz_localize(None)
+        # Compare datetime64 values against day bounds rather than building a
+        # Python date object per row.
         mask = effective_dates.notna()
         if sample_start_date is not None:
-            mask &= effective_dates.dt.date >= sample_start_date
+            mask &= effective_dates >= pd.Timestamp(sample_start_date)
         if sample_end_date is not None:
-            mask &= effective_dates.dt.date <= sample_end_date
+            mask &= effective_dates < pd.Timestamp(sample_end_date) + pd.Timedelta(days=1)
         filtered_df = df.loc[mask].copy()
         logger.info(
             f"{log_prefix}: Applied exact sample window filter "
@@ -1547,9 +1762,10 @@ class EPCAPIDownloader:
         sample_start_date: Optional[date_cls] = None,
         sample_end_date: Optional[date_cls] = None,
         max_results_per_borough: Optional[int] = None,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
         log_boroughs: bool = True,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        use_search_cache: Optional[bool] = None,
     ) -> pd.DataFrame:
         property_types = property_types or ['house']
         if self.download_mode == "full_load":
@@ -1595,75 +1811,95 @@ class EPCAPIDownloader:
                 )
             return subset.load_dataframe()
 
-        frames = []
-        for borough in self.LONDON_LA_CODES:
-            for property_type in property_types:
-                request_context = self._build_request_context(
+        def download_one(borough: str, property_type: str) -> pd.DataFrame:
+            request_context = self._build_request_context(
+                borough_name=borough,
+                property_type=property_type,
+                sample_start_date=sample_start_date,
+                sample_end_date=sample_end_date,
+            )
+            try:
+                return self.download_borough_data(
                     borough_name=borough,
                     property_type=property_type,
+                    from_year=from_year,
                     sample_start_date=sample_start_date,
                     sample_end_date=sample_end_date,
+                    max_results=max_results_per_borough,
+                    log_borough=log_boroughs,
+                    progress_bar=pbar,
+                    use_search_cache=use_search_cache,
                 )
-                try:
-                    df = self.download_borough_data(
-                        borough_name=borough,
-                        property_type=property_type,
-                        from_year=from_year,
-                        sample_start_date=sample_start_date,
-                        sample_end_date=sample_end_date,
-                        max_results=max_results_per_borough,
-                        log_borough=log_boroughs,
-                        show_progress=log_boroughs,
-                    )
-                except EPCDownloadError as e:
-                    logger.error(f"Fail-fast borough download abort: {e}")
-                    raise
-                except urllib.error.HTTPError as e:
-                    wrapped_error = EPCDownloadError.from_http_error(request_context, e)
-                    logger.error(f"Fail-fast borough download abort: {wrapped_error}")
-                    raise wrapped_error from e
-                except urllib.error.URLError as e:
-                    wrapped_error = EPCDownloadError.from_url_error(request_context, e)
-                    logger.error(f"Fail-fast borough download abort: {wrapped_error}")
-                    raise wrapped_error from e
-                except Exception as e:
-                    wrapped_error = EPCDownloadError.unexpected(request_context, e)
-                    logger.error(f"Fail-fast borough download abort: {wrapped_error}")
-                    raise wrapped_error from e
-                if not df.empty:
-                    frames.append(df)
+            except EPCDownloadError as e:
+                logger.error(f"Fail-fast borough download abort: {e}")
+                raise
+            except urllib.error.HTTPError as e:
+                wrapped_error = EPCDownloadError.from_http_error(request_context, e)
+                logger.error(f"Fail-fast borough download abort: {wrapped_error}")
+                raise wrapped_error from e
+            except urllib.error.URLError as e:
+                wrapped_error = EPCDownloadError.from_url_error(request_context, e)
+                logger.error(f"Fail-fast borough download abort: {wrapped_error}")
+                raise wrapped_error from e
+            except Exception as e:
+                wrapped_error = EPCDownloadError.unexpected(request_context, e)
+                logger.error(f"Fail-fast borough download abort: {wrapped_error}")
+                raise wrapped_error from e
+
+        jobs = [
+            (borough, property_type)
+            for borough in self.LONDON_LA_CODES
+            for property_type in property_types
+        ]
+        # Threads only wait on HTTP, so size the pool to the in-flight request cap
+        # rather than HEATSTREET_WORKERS, which sizes the scenario process pool.
+        workers = max(1, min(max_workers or get_max_inflight_requests(), len(jobs)))
+        # One bar for the whole London pull rather than one per borough thread.
+        pbar = tqdm(desc="London", unit=" records", disable=not log_boroughs, mininterval=0.5)
+        if workers == 1:
+            try:
+                results = [download_one(borough, property_type) for borough, property_type in jobs]
+            finally:
+                pbar.close()
+        else:
+            # Search requests are latency-bound, so a small thread pool overlaps the
+            # round-trips; _request_json already backs off on HTTP 429. The first
+            # failure cancels every request that has not started yet.
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = [executor.submit(download_one, borough, property_type) for borough, property_type in jobs]
+                for future in as_completed(futures):
+                    future.result()
+                results = [future.result() for future in futures]
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                pbar.close()
+
+        frames = [df for df in results if not df.empty]
         return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
+    @staticmethod
+    def _text_isin_mask(series: pd.Series, allowed: Iterable[str]) -> np.ndarray:
+        """Case/whitespace-insensitive membership test evaluated once per distinct value."""
+        codes, uniques = pd.factorize(series, use_na_sentinel=True)
+        allowed_folded = {value.casefold() for value in allowed}
+        keep = pd.Index(uniques).astype(str).str.strip().str.casefold().isin(allowed_folded)
+        # Append False so the NA sentinel (-1) indexes a non-match.
+        return np.append(keep, False)[codes]
+
     def apply_edwardian_filters(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Applying pre-1930 terraced house stock filters...")
-        df = df.copy()
+        # Only the labels change, so a shallow copy leaves the caller's frame intact.
+        df = df.copy(deep=False)
         df.columns = df.columns.str.replace('-', '_').str.upper()
         initial_count = len(df)
         if df.empty:
             return df
         self.ensure_stock_definition_columns(df)
 
-        property_mask = (
-            df['PROPERTY_TYPE']
-            .astype(str)
-            .str.strip()
-            .str.casefold()
-            .eq('house')
-        )
-        construction_mask = (
-            df['CONSTRUCTION_AGE_BAND']
-            .astype(str)
-            .str.strip()
-            .str.casefold()
-            .isin({band.casefold() for band in self.PRE_1930_AGE_BANDS})
-        )
-        terrace_mask = (
-            df['BUILT_FORM']
-            .astype(str)
-            .str.strip()
-            .str.casefold()
-            .isin({form.casefold() for form in self.TERRACE_FORMS})
-        )
+        property_mask = self._text_isin_mask(df['PROPERTY_TYPE'], {'house'})
+        construction_mask = self._text_isin_mask(df['CONSTRUCTION_AGE_BAND'], self.PRE_1930_AGE_BANDS)
+        terrace_mask = self._text_isin_mask(df['BUILT_FORM'], self.TERRACE_FORMS)
         df = df.loc[property_mask & construction_mask & terrace_mask].copy()
         if initial_count:
             logger.info(f"Filtering complete: {len(df):,} / {initial_count:,} records retained ({len(df)/initial_count*100:.1f}%)")
@@ -1686,23 +1922,78 @@ class EPCAPIDownloader:
                 )
 
         csv_path = DATA_RAW_DIR / filename
-        df.to_csv(csv_path, index=False)
+        table = self._to_arrow_table(df)
+        self._write_csv(df, csv_path, table=table)
         logger.info(f"Saved {len(df):,} records to: {csv_path}")
         try:
+            import pyarrow.parquet as pq
+
+            if table is None:
+                raise ValueError("DataFrame could not be converted to an Arrow table")
             parquet_path = csv_path.with_suffix('.parquet')
-            df_parquet = df.copy()
-            for col in df_parquet.columns:
-                if df_parquet[col].dtype == 'object':
-                    df_parquet[col] = df_parquet[col].astype(str)
-            df_parquet.to_parquet(parquet_path, index=False)
+            pq.write_table(table, parquet_path, compression="zstd")
         except Exception as e:
             logger.warning(f"Could not save as parquet: {e}")
 
+    @staticmethod
+    def _to_arrow_table(df: pd.DataFrame):
+        """
+        Convert once for both the CSV and Parquet writers.
+
+        Homogeneous columns transfer without a pandas copy; only when Arrow
+        rejects a mixed object column are object columns turned into text on a
+        shallow copy, keeping missing values null.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return None
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df_text = df.copy(deep=False)
+            for col in df_text.select_dtypes(include=['object']).columns:
+                values = df_text[col]
+                df_text[col] = values.astype(str).where(values.notna())
+            try:
+                return pa.Table.from_pandas(df_text, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                logger.debug(f"Arrow conversion failed; falling back to pandas writers: {e}")
+                return None
+
+    @staticmethod
+    def _write_csv(df: pd.DataFrame, csv_path: Path, table=None) -> None:
+        """Write a CSV with Arrow's multithreaded writer, falling back to pandas."""
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+
+            if table is None:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, csv_path, write_options=pacsv.WriteOptions(batch_size=65536))
+        except Exception as e:
+            logger.debug(f"Arrow CSV writer unavailable for {csv_path.name}; using pandas: {e}")
+            df.to_csv(csv_path, index=False)
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Download London EPC certificates.")
+    parser.add_argument("--download-mode", choices=["full_load", "search"], default="full_load")
+    parser.add_argument(
+        "--use-search-cache",
+        action="store_true",
+        help="Reuse borough search results cached within the last "
+        f"{EPCAPIDownloader.SEARCH_CACHE_TTL_DAYS} days (search mode only)",
+    )
+    args = parser.parse_args()
+
     logger.info("Starting EPC API data acquisition...")
-    downloader = EPCAPIDownloader(download_mode="full_load")
-    df = downloader.download_all_london_boroughs(property_types=['house'], from_year=2015)
+    downloader = EPCAPIDownloader(download_mode=args.download_mode)
+    df = downloader.download_all_london_boroughs(
+        property_types=['house'],
+        from_year=2015,
+        use_search_cache=args.use_search_cache,
+    )
     if not df.empty:
         downloader.save_data(df, "epc_london_raw.csv")
         df_filtered = downloader.apply_edwardian_filters(df)
@@ -6,7 +6,7 @@ import csv
 import hashlib
 from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Sequence
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from loguru import logger
 
@@ -23,6 +23,11 @@ except ImportError:
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 EXTERNAL_DIR = PROJECT_ROOT / "data" / "external"
 
+# Parsed HNPD rows keyed by CSV path, tagged with the (mtime_ns, size) they were
+# read at. Summary, validation and tier loading all start from the same rows,
+# so a process only re-parses the file when it changes on disk.
+_ROWS_CACHE: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+
 
 class HNPDDownloader:
     """Validate the local HNPD CSV and expose Tier 1 and Tier 2 scheme points.
@@ -87,6 +92,7 @@ class HNPDDownloader:
         self.tier_2_statuses = self._merge_statuses(
             hnpd_cfg.get("tier_2_statuses") or (), self.TIER_2_STATUSES
         )
+        self._validation_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
         self.external_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Initialized HNPD loader ({self.csv_path})")
 
@@ -153,9 +159,22 @@ class HNPDDownloader:
             "filename without updating config/config.yaml and validating its schema."
         )
 
+    def _file_signature(self) -> Tuple[int, int]:
+        stat = self.csv_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
     def _read_rows(self) -> List[Dict[str, Any]]:
         if not self.csv_path.exists():
             return []
+        signature = self._file_signature()
+        cached = _ROWS_CACHE.get(str(self.csv_path))
+        if cached is None or cached[0] != signature:
+            cached = (signature, self._parse_rows())
+            _ROWS_CACHE[str(self.csv_path)] = cached
+        # Hand out copies so callers that edit rows cannot alter the cached parse.
+        return [dict(row) for row in cached[1]]
+
+    def _parse_rows(self) -> List[Dict[str, Any]]:
         last_decode_error: Optional[Exception] = None
         for encoding in ("utf-8-sig", "latin-1"):
             try:
@@ -177,6 +196,18 @@ class HNPDDownloader:
                 "reason": self.manual_download_instructions(),
                 "csv_path": str(self.csv_path),
             }
+        signature = self._file_signature()
+        if self._validation_cache is None or self._validation_cache[0] != signature:
+            self._validation_cache = (signature, self._validate_rows())
+        validation = dict(self._validation_cache[1])
+        if validation["valid"]:
+            # The provenance hash is always taken from the bytes on disk; an
+            # unchanged (mtime_ns, size) pair does not prove unchanged content.
+            validation["sha256"] = hashlib.sha256(self.csv_path.read_bytes()).hexdigest()
+            validation["size_bytes"] = self.csv_path.stat().st_size
+        return validation
+
+    def _validate_rows(self) -> Dict[str, Any]:
         try:
             rows = self._read_rows()
         except Exception as exc:
@@ -223,7 +254,6 @@ class HNPDDownloader:
                 "rows": len(rows),
             }
 
-        digest = hashlib.sha256(self.csv_path.read_bytes()).hexdigest()
         return {
             "valid": True,
             "reason": "ok",
@@ -231,8 +261,6 @@ class HNPDDownloader:
             "coordinates_available": valid_coordinates,
             "london_rows": london_rows,
             "london_coordinates_available": london_valid_coordinates,
-            "sha256": digest,
-            "size_bytes": self.csv_path.stat().st_size,
             "filename": self.csv_path.name,
         }
 
@@ -15,6 +15,8 @@ from typing import Dict, List, Optional, Tuple
 from loguru import logger
 from datetime import datetime
 
+from src.utils.staged_dataset import require_duckdb, sql_identifier
+
 
 class AdditionalReports:
     """Generate specialized reports and analysis extracts."""
@@ -180,26 +182,65 @@ class AdditionalReports:
         id_col = self._first_available_column(
             df, ['CERTIFICATE_NUMBER', 'LMK_KEY']
         )
-        borough_breakdown = df.groupby('LOCAL_AUTHORITY').agg({
-            id_col: 'count',  # Property count
-            'CURRENT_ENERGY_EFFICIENCY': 'mean',
-            'ENERGY_CONSUMPTION_CURRENT': 'mean',
-            'CO2_EMISSIONS_CURRENT': 'mean',
-            'TOTAL_FLOOR_AREA': 'mean',
-            'CURRENT_ENERGY_RATING': lambda x: x.mode()[0] if len(x.mode()) > 0 else 'Unknown',
-        }).round(1)
-
-        borough_breakdown.columns = [
-            'property_count',
-            'mean_epc_rating',
-            'mean_energy_kwh_m2_year',
-            'mean_co2_tonnes_year',
-            'mean_floor_area_m2',
-            'modal_epc_band',
+        columns = [
+            'LOCAL_AUTHORITY',
+            id_col,
+            'CURRENT_ENERGY_EFFICIENCY',
+            'ENERGY_CONSUMPTION_CURRENT',
+            'CO2_EMISSIONS_CURRENT',
+            'TOTAL_FLOOR_AREA',
+            'CURRENT_ENERGY_RATING',
         ]
-
-        # Sort by property count descending
-        borough_breakdown = borough_breakdown.sort_values('property_count', ascending=False)
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise KeyError(f"Borough breakdown is missing required columns: {missing}")
+
+        # Aggregate in DuckDB: one vectorized hash aggregation instead of a
+        # pandas group-by with a per-borough Python mode() callback. The modal
+        # band breaks ties on the lowest label, matching Series.mode()[0].
+        db = require_duckdb()
+        conn = db.connect()
+        try:
+            conn.register('borough_source', df[columns])
+            borough_breakdown = conn.execute(
+                f"""
+                WITH stats AS (
+                    SELECT
+                        LOCAL_AUTHORITY,
+                        COUNT({sql_identifier(id_col)}) AS property_count,
+                        AVG(CURRENT_ENERGY_EFFICIENCY) AS mean_epc_rating,
+                        AVG(ENERGY_CONSUMPTION_CURRENT) AS mean_energy_kwh_m2_year,
+                        AVG(CO2_EMISSIONS_CURRENT) AS mean_co2_tonnes_year,
+                        AVG(TOTAL_FLOOR_AREA) AS mean_floor_area_m2
+                    FROM borough_source
+                    WHERE LOCAL_AUTHORITY IS NOT NULL
+                    GROUP BY LOCAL_AUTHORITY
+                ),
+                bands AS (
+                    SELECT
+                        LOCAL_AUTHORITY,
+                        CURRENT_ENERGY_RATING AS modal_epc_band,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY LOCAL_AUTHORITY
+                            ORDER BY COUNT(*) DESC, CURRENT_ENERGY_RATING
+                        ) AS band_rank
+                    FROM borough_source
+                    WHERE LOCAL_AUTHORITY IS NOT NULL AND CURRENT_ENERGY_RATING IS NOT NULL
+                    GROUP BY LOCAL_AUTHORITY, CURRENT_ENERGY_RATING
+                )
+                SELECT
+                    stats.*,
+                    COALESCE(bands.modal_epc_band, 'Unknown') AS modal_epc_band
+                FROM stats
+                LEFT JOIN bands
+                    ON bands.LOCAL_AUTHORITY = stats.LOCAL_AUTHORITY AND bands.band_rank = 1
+                ORDER BY property_count DESC, stats.LOCAL_AUTHORITY
+                """
+            ).fetchdf()
+        finally:
+            conn.close()
+
+        borough_breakdown = borough_breakdown.set_index('LOCAL_AUTHORITY').round(1)
 
         logger.info(f"Generated breakdown for {len(borough_breakdown)} boroughs")
 
@@ -9,8 +9,6 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional
-import matplotlib.pyplot as plt
-import seaborn as sns
 from loguru import logger
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -33,7 +31,10 @@ class ArchetypeAnalyzer:
         self.config = load_config()
         self.results = {}
 
-        # Set visualization style
+        # Set visualization style; plotting libraries load here, not at CLI startup
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         sns.set_style("whitegrid")
         plt.rcParams['figure.figsize'] = (12, 8)
 
@@ -656,15 +657,20 @@ def main():
     logger.info("Starting archetype characterization...")
 
     # Load validated data
-    input_file = DATA_PROCESSED_DIR / "epc_london_validated.csv"
+    input_file = DATA_PROCESSED_DIR / "epc_london_validated.parquet"
 
     if not input_file.exists():
-        logger.error(f"Input file not found: {input_file}")
-        logger.info("Please run data validation first")
-        return
+        input_file = DATA_PROCESSED_DIR / "epc_london_validated.csv"
+        if not input_file.exists():
+            logger.error(f"Input file not found: {input_file}")
+            logger.info("Please run data validation first")
+            return
 
     logger.info(f"Loading data from: {input_file}")
-    df = pd.read_csv(input_file)
+    if input_file.suffix == '.parquet':
+        df = pd.read_parquet(input_file)
+    else:
+        df = pd.read_csv(input_file)
 
     # Perform analysis
     analyzer = ArchetypeAnalyzer()
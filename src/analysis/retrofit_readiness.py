@@ -878,10 +878,14 @@ def main():
     """Example usage."""
     from config.config import DATA_PROCESSED_DIR
 
-    # Load processed data (prefer adjusted dataset if available)
-    input_path = DATA_PROCESSED_DIR / "epc_london_adjusted.csv"
-    if not input_path.exists():
-        input_path = DATA_PROCESSED_DIR / "epc_london_validated.csv"
+    # Load processed data (prefer adjusted dataset if available, Parquet before CSV)
+    candidates = [
+        DATA_PROCESSED_DIR / "epc_london_adjusted.parquet",
+        DATA_PROCESSED_DIR / "epc_london_adjusted.csv",
+        DATA_PROCESSED_DIR / "epc_london_validated.parquet",
+        DATA_PROCESSED_DIR / "epc_london_validated.csv",
+    ]
+    input_path = next((path for path in candidates if path.exists()), candidates[-1])
 
     if not input_path.exists():
         raise FileNotFoundError(
@@ -890,7 +894,7 @@ def main():
             f" - {DATA_PROCESSED_DIR / 'epc_london_validated.csv'}"
         )
 
-    df = pd.read_csv(input_path)
+    df = pd.read_parquet(input_path) if input_path.suffix == '.parquet' else pd.read_csv(input_path)
     logger.info(f"Loaded {len(df):,} records from {input_path}")
 
     # Run readiness analysis
@@ -774,8 +774,6 @@ class EPCDataValidator:
         - roof_insulation_category: none, minimal (<100mm), partial (100-200mm),
                                      good (200-270mm), excellent (>270mm), unknown
         """
-        import re
-
         # Initialize columns
         df['roof_insulation_thickness_mm'] = np.nan
         df['roof_insulation_category'] = 'unknown'
@@ -783,23 +781,17 @@ class EPCDataValidator:
         # Try to extract thickness from ROOF_DESCRIPTION
         if 'ROOF_DESCRIPTION' in df.columns:
             roof_desc = df['ROOF_DESCRIPTION'].fillna('')
+            roof_desc_lower = roof_desc.astype(str).str.lower()
 
-            def extract_thickness(desc):
-                """Extract numeric thickness from description string."""
-                desc = str(desc).lower()
-
-                # Look for explicit mm values
-                match = re.search(r'(\d+)\s*mm', desc)
-                if match:
-                    return int(match.group(1))
-
-                # No insulation patterns
-                if any(p in desc for p in ['no insulation', 'uninsulated', '0 mm', '0mm']):
-                    return 0
-
-                return None
-
-            df['roof_insulation_thickness_mm'] = roof_desc.apply(extract_thickness)
+            # First explicit mm value wins; otherwise "no insulation" patterns mean 0mm
+            thickness = pd.to_numeric(
+                roof_desc_lower.str.extract(r'(\d+)\s*mm', expand=False),
+                errors='coerce',
+            )
+            no_insulation_text = roof_desc_lower.str.contains(
+                'no insulation|uninsulated|0 mm|0mm', regex=True
+            )
+            df['roof_insulation_thickness_mm'] = thickness.mask(thickness.isna() & no_insulation_text, 0)
 
             # Also check for qualitative descriptions
             no_insulation = roof_desc.str.lower().str.contains(
@@ -1254,40 +1246,38 @@ def filter_properties(
         # Get uninsulated solid wall properties
         df_filtered = filter_properties(df, wall_type='solid_brick', has_wall_insulation=False)
     """
-    df_filtered = df.copy()
-    initial_count = len(df_filtered)
+    # Combine every criterion into one mask and slice the frame once at the end,
+    # rather than copying the surviving rows after each filter.
+    initial_count = len(df)
+    mask = np.ones(initial_count, dtype=bool)
 
     # Filter by tenure
     if tenure is not None:
-        if 'tenure' in df_filtered.columns:
-            df_filtered = df_filtered[df_filtered['tenure'] == tenure]
-            logger.info(f"Filtered by tenure={tenure}: {len(df_filtered):,} properties")
+        if 'tenure' in df.columns:
+            mask &= (df['tenure'] == tenure).to_numpy(dtype=bool, na_value=False)
+            logger.info(f"Filtered by tenure={tenure}: {int(mask.sum()):,} properties")
         else:
             logger.warning("tenure column not found, skipping tenure filter")
 
     # Filter by EPC band range
     if epc_band_range is not None:
-        if 'CURRENT_ENERGY_RATING' in df_filtered.columns:
+        if 'CURRENT_ENERGY_RATING' in df.columns:
             band_order = {'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7}
             min_band, max_band = epc_band_range
             min_val = band_order.get(min_band, 1)
             max_val = band_order.get(max_band, 7)
 
-            df_filtered['_band_numeric'] = df_filtered['CURRENT_ENERGY_RATING'].map(band_order)
-            df_filtered = df_filtered[
-                (df_filtered['_band_numeric'] >= min_val) &
-                (df_filtered['_band_numeric'] <= max_val)
-            ]
-            df_filtered = df_filtered.drop(columns=['_band_numeric'])
-            logger.info(f"Filtered by EPC bands {min_band}-{max_band}: {len(df_filtered):,} properties")
+            band_numeric = df['CURRENT_ENERGY_RATING'].map(band_order)
+            mask &= ((band_numeric >= min_val) & (band_numeric <= max_val)).to_numpy()
+            logger.info(f"Filtered by EPC bands {min_band}-{max_band}: {int(mask.sum()):,} properties")
 
     # Filter by construction year
     if year_built_range is not None:
-        if 'CONSTRUCTION_AGE_BAND' in df_filtered.columns:
+        if 'CONSTRUCTION_AGE_BAND' in df.columns:
             start_year, end_year = year_built_range
             # This is a simplified filter - would need more sophisticated parsing
             # of CONSTRUCTION_AGE_BAND for precise filtering
-            age_band = df_filtered['CONSTRUCTION_AGE_BAND'].fillna('')
+            age_band = df['CONSTRUCTION_AGE_BAND'].fillna('')
 
             # Filter for bands that overlap with the range
             def band_in_range(band):
@@ -1305,28 +1295,30 @@ def filter_properties(
                 # Default: include if we can't parse
                 return True
 
-            df_filtered = df_filtered[age_band.apply(band_in_range)]
-            logger.info(f"Filtered by year range {start_year}-{end_year}: {len(df_filtered):,} properties")
+            # Age bands repeat heavily, so evaluate each distinct label once.
+            band_matches = {band: band_in_range(band) for band in age_band.unique()}
+            mask &= age_band.map(band_matches).to_numpy(dtype=bool)
+            logger.info(f"Filtered by year range {start_year}-{end_year}: {int(mask.sum()):,} properties")
 
     # Filter by property type
     if property_type is not None:
-        if 'PROPERTY_TYPE' in df_filtered.columns:
-            df_filtered = df_filtered[
-                df_filtered['PROPERTY_TYPE'].str.contains(property_type, case=False, na=False)
-            ]
-            logger.info(f"Filtered by property_type={property_type}: {len(df_filtered):,} properties")
+        if 'PROPERTY_TYPE' in df.columns:
+            mask &= df['PROPERTY_TYPE'].str.contains(property_type, case=False, na=False).to_numpy(dtype=bool)
+            logger.info(f"Filtered by property_type={property_type}: {int(mask.sum()):,} properties")
 
     # Filter by wall type
     if wall_type is not None:
-        if 'wall_type' in df_filtered.columns:
-            df_filtered = df_filtered[df_filtered['wall_type'] == wall_type]
-            logger.info(f"Filtered by wall_type={wall_type}: {len(df_filtered):,} properties")
+        if 'wall_type' in df.columns:
+            mask &= (df['wall_type'] == wall_type).to_numpy(dtype=bool, na_value=False)
+            logger.info(f"Filtered by wall_type={wall_type}: {int(mask.sum()):,} properties")
 
     # Filter by wall insulation status
     if has_wall_insulation is not None:
-        if 'wall_insulated' in df_filtered.columns:
-            df_filtered = df_filtered[df_filtered['wall_insulated'] == has_wall_insulation]
-            logger.info(f"Filtered by has_wall_insulation={has_wall_insulation}: {len(df_filtered):,} properties")
+        if 'wall_insulated' in df.columns:
+            mask &= (df['wall_insulated'] == has_wall_insulation).to_numpy(dtype=bool, na_value=False)
+            logger.info(f"Filtered by has_wall_insulation={has_wall_insulation}: {int(mask.sum()):,} properties")
+
+    df_filtered = df.loc[mask].copy()
 
     # Log summary
     final_count = len(df_filtered)
@@ -11,10 +11,8 @@ from typing import Dict, Iterable, List, Optional
 
 import matplotlib
 matplotlib.use("Agg", force=True)
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
 from loguru import logger
 
 from config.config import DATA_OUTPUTS_DIR, get_cost_assumptions, get_heat_network_params, load_config
@@ -103,6 +101,10 @@ class ComparisonReporter:
         self.figures_dir = self.outputs_dir / "figures"
         self.figures_dir.mkdir(parents=True, exist_ok=True)
 
+        # pyplot/seaborn are imported on first use so importing this module stays cheap
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         sns.set_style("whitegrid")
         sns.set_palette("husl")
         plt.rcParams['figure.figsize'] = (12, 6)
@@ -275,6 +277,9 @@ class ComparisonReporter:
         metrics = ['capex_mean', 'bill_saving_mean', 'co2_saving_mean']
         metric_labels = ['CAPEX (£)', 'Annual bill saving (£/yr)', 'Annual CO₂ saving (t/yr)']
 
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.clf()
         fig, axes = plt.subplots(1, 3, figsize=(15, 5), sharey=False)
 
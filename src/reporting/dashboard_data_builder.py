@@ -61,6 +61,12 @@ BOROUGH_NAME_BY_CODE = {
 import numpy as np
 from loguru import logger
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
 from config.config import DATA_OUTPUTS_DIR, get_cost_reduction_levers, get_scenario_label_map, get_resolved_energy_prices
 from src.utils.analysis_logger import convert_to_json_serializable
 from src.utils.run_metadata import get_total_properties_from_metadata
@@ -210,8 +216,18 @@ class DashboardDataBuilder:
     def write_dataset(self, dataset: Dict) -> Path:
         """Persist the dataset to the outputs directory."""
         output_path = self.output_dir / "dashboard-data.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(dataset, f, indent=2)
+        if _ORJSON_AVAILABLE:
+            # orjson serializes in C, handles NumPy scalars/arrays directly and
+            # writes NaN/Inf as null, which the browser's JSON.parse accepts.
+            output_path.write_bytes(
+                orjson.dumps(
+                    dataset,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(dataset, f, indent=2)
 
         logger.info(f"✓ Dashboard dataset written to {output_path}")
         return output_path
@@ -8,6 +8,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import matplotlib
+
+# Figures are only ever saved to disk; Agg also keeps report worker
+# processes from initialising a GUI backend.
+matplotlib.use("Agg", force=True)
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -27,6 +32,18 @@ from config.config import (
 from src.reporting.report_headline_data import build_report_headline_dataframe
 from src.modeling.contracts import TIER_READINESS_LABELS
 
+# zlib level 4 keeps PNG sizes within a few percent of Pillow's default (6)
+# while cutting encode time, which dominates savefig for 300 dpi charts.
+PNG_COMPRESS_LEVEL = 4
+
+
+def save_figure(save_path, fig=None, **kwargs):
+    """Save a figure (the current one by default), using the faster PNG compression for .png paths."""
+    fig = fig if fig is not None else plt.gcf()
+    if Path(save_path).suffix.lower() == ".png":
+        kwargs.setdefault("pil_kwargs", {"compress_level": PNG_COMPRESS_LEVEL})
+    fig.savefig(save_path, **kwargs)
+
 
 class ReportGenerator:
     """
@@ -116,7 +133,7 @@ class ReportGenerator:
         ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x):,}'))
 
         plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         plt.close()
 
         logger.info(f"Saved EPC band distribution to: {save_path}")
@@ -228,7 +245,7 @@ class ReportGenerator:
                 )
 
         fig.tight_layout()
-        fig.savefig(save_counts_path, dpi=300, bbox_inches="tight")
+        save_figure(save_counts_path, fig, dpi=300, bbox_inches="tight")
         plt.close(fig)
         logger.info(f"Saved EPC lodgements-by-year chart to: {save_counts_path}")
 
@@ -244,31 +261,59 @@ class ReportGenerator:
             ax.set_ylim(0, 100)
             ax.legend(title="EPC band", bbox_to_anchor=(1.02, 1), loc="upper left")
             fig.tight_layout()
-            fig.savefig(save_share_path, dpi=300, bbox_inches="tight")
+            save_figure(save_share_path, fig, dpi=300, bbox_inches="tight")
             plt.close(fig)
             logger.info(f"Saved EPC lodgements-by-year share chart to: {save_share_path}")
 
+    @staticmethod
+    def summarize_sap_scores(sap_data, bins: int = 30) -> Dict:
+        """
+        Bin SAP scores once with NumPy for plot_sap_score_distribution.
+
+        Args:
+            sap_data: SAP scores (Series or NumPy array, missing values removed)
+            bins: Number of equal-width histogram bins
+
+        Returns:
+            Dictionary with histogram counts and edges plus the mean and median
+        """
+        sap_data = np.asarray(sap_data, dtype=float)
+        counts, edges = np.histogram(sap_data, bins=bins)
+        return {
+            'counts': counts,
+            'edges': edges,
+            'mean': float(sap_data.mean()),
+            'median': float(np.median(sap_data)),
+        }
+
     def plot_sap_score_distribution(
         self,
-        sap_data: pd.Series,
+        sap_data,
         save_path: Optional[Path] = None
     ):
         """
         Create histogram of SAP score distribution.
 
         Args:
-            sap_data: Series of SAP scores
+            sap_data: SAP scores (Series or NumPy array, missing values removed),
+                or a pre-binned summary from summarize_sap_scores
             save_path: Path to save figure
         """
         logger.info("Creating SAP score distribution chart...")
+        if not isinstance(sap_data, dict):
+            sap_data = self.summarize_sap_scores(sap_data)
 
         if save_path is None:
             save_path = self.output_dir / "sap_score_distribution.png"
 
         fig, ax = plt.subplots(figsize=(12, 6))
 
-        # Histogram
-        n, bins, patches = ax.hist(sap_data, bins=30, edgecolor='black', alpha=0.7, color='steelblue')
+        # Histogram drawn from the pre-binned counts (one weighted sample per bin)
+        edges = sap_data['edges']
+        n, bins, patches = ax.hist(
+            edges[:-1], bins=edges, weights=sap_data['counts'],
+            edgecolor='black', alpha=0.7, color='steelblue',
+        )
 
         # Color bars by EPC band thresholds
         band_thresholds = [0, 21, 39, 55, 69, 81, 92, 100]
@@ -282,11 +327,11 @@ class ReportGenerator:
                     break
 
         # Add mean line
-        mean_sap = sap_data.mean()
+        mean_sap = sap_data['mean']
         ax.axvline(mean_sap, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_sap:.1f}')
 
         # Add median line
-        median_sap = sap_data.median()
+        median_sap = sap_data['median']
         ax.axvline(median_sap, color='darkred', linestyle=':', linewidth=2, label=f'Median: {median_sap:.1f}')
 
         ax.set_xlabel('SAP Score', fontsize=13, fontweight='bold')
@@ -299,7 +344,7 @@ class ReportGenerator:
         ax.set_axisbelow(True)
 
         plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         plt.close()
 
         logger.info(f"Saved SAP score distribution to: {save_path}")
@@ -350,7 +395,7 @@ class ReportGenerator:
 
         plt.suptitle('Decarbonization Scenario Comparison', fontsize=14, fontweight='bold', y=1.02)
         plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         plt.close()
 
         logger.info(f"Saved scenario comparison to: {save_path}")
@@ -418,7 +463,7 @@ class ReportGenerator:
 
         plt.suptitle('Subsidy Sensitivity Analysis', fontsize=14, fontweight='bold', y=1.00)
         plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         plt.close()
 
         logger.info(f"Saved subsidy sensitivity to: {save_path}")
@@ -508,7 +553,7 @@ class ReportGenerator:
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
 
         plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         plt.close()
 
         logger.info(f"Saved EPC band shifts to: {save_path}")
@@ -583,7 +628,7 @@ class ReportGenerator:
                     ha='center', va='bottom', fontsize=10, fontweight='bold')
 
         plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         plt.close()
 
         logger.info(f"Saved cost-effectiveness summary to: {save_path}")
@@ -871,7 +916,7 @@ class ReportGenerator:
         )
 
         fig.tight_layout(rect=[0, 0.03, 1, 1])
-        fig.savefig(save_png, dpi=300, bbox_inches="tight")
+        save_figure(save_png, fig, dpi=300, bbox_inches="tight")
         fig.savefig(save_svg, bbox_inches="tight")
         plt.close(fig)
 
@@ -915,7 +960,7 @@ class ReportGenerator:
             ax2.grid(True, alpha=0.3, axis='x')
 
         plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         plt.close()
 
         logger.info(f"Saved heat network tiers to: {save_path}")
@@ -1240,15 +1285,15 @@ class ReportGenerator:
                 )
 
             if not tier_summary.empty:
-                tier_rows = []
-                for _, row in tier_summary.iterrows():
-                    tier_rows.append({
-                        "tier": row["Tier"],
-                        "property_count": row["Property Count"],
-                        "percentage": row["Percentage"],
-                        "recommended_pathway": row["Recommended Pathway"],
-                    })
-                pd.DataFrame(tier_rows).to_excel(writer, sheet_name="Heat Network Tiers", index=False)
+                tier_columns = {
+                    "Tier": "tier",
+                    "Property Count": "property_count",
+                    "Percentage": "percentage",
+                    "Recommended Pathway": "recommended_pathway",
+                }
+                tier_summary[list(tier_columns)].rename(columns=tier_columns).to_excel(
+                    writer, sheet_name="Heat Network Tiers", index=False
+                )
 
             pd.DataFrame(dashboard_tabs, columns=["tab", "description"]).to_excel(
                 writer, sheet_name="Dashboard Coverage", index=False
@@ -1288,14 +1333,19 @@ class ReportGenerator:
 
         try:
             import openpyxl
-            from openpyxl.styles import Font, Alignment, PatternFill
-            from openpyxl.utils.dataframe import dataframe_to_rows
         except ImportError:
             logger.warning("openpyxl not installed. Using basic Excel export...")
-            # Fallback to basic pandas export
-            with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
+            # Fallback to a basic xlsxwriter export. Rows are written whole with
+            # write_row, so constant_memory can flush each row as it is finished.
+            import xlsxwriter
+
+            workbook = xlsxwriter.Workbook(
+                str(output_path),
+                {'constant_memory': True, 'strings_to_urls': False, 'nan_inf_to_errors': True},
+            )
+            try:
                 self._export_basic_excel(
-                    writer,
+                    workbook,
                     archetype_results,
                     scenario_results,
                     subsidy_results,
@@ -1303,45 +1353,59 @@ class ReportGenerator:
                     borough_breakdown,
                     case_street_summary,
                 )
+            finally:
+                workbook.close()
             logger.info(f"Basic Excel export saved to: {output_path}")
             return
 
-        # Create workbook with formatted sheets
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        # Write-only workbooks stream rows to the serializer (lxml when available)
+        # instead of holding every cell object in memory until save.
+        workbook = openpyxl.Workbook(write_only=True)
 
-            # Sheet 1: Executive Summary
-            self._write_summary_sheet(writer, archetype_results, scenario_results)
+        # Sheet 1: Executive Summary
+        self._write_summary_sheet(workbook, archetype_results, scenario_results)
 
-            # Sheet 2: EPC Band Distribution
-            if 'epc_bands' in archetype_results:
-                self._write_epc_bands_sheet(writer, archetype_results['epc_bands'])
-
-            # Sheet 3: Scenario Comparison
-            if scenario_results:
-                self._write_scenarios_sheet(writer, scenario_results)
-
-            # Sheet 4: Subsidy Sensitivity
-            if subsidy_results:
-                self._write_subsidy_sheet(writer, subsidy_results)
-
-            # Sheet 5: Report Headline Data
-            headline_df = build_report_headline_dataframe(
-                archetype_results=archetype_results,
-                scenario_results=scenario_results,
-                subsidy_results=subsidy_results,
-                borough_breakdown=borough_breakdown,
-                case_street_summary=case_street_summary,
-            )
-            headline_df.to_excel(writer, sheet_name="report_headline_data", index=False)
+        # Sheet 2: EPC Band Distribution
+        if 'epc_bands' in archetype_results:
+            self._write_epc_bands_sheet(workbook, archetype_results['epc_bands'])
+
+        # Sheet 3: Scenario Comparison
+        if scenario_results:
+            self._write_scenarios_sheet(workbook, scenario_results)
+
+        # Sheet 4: Subsidy Sensitivity
+        if subsidy_results:
+            self._write_subsidy_sheet(workbook, subsidy_results)
+
+        # Sheet 5: Report Headline Data
+        headline_df = build_report_headline_dataframe(
+            archetype_results=archetype_results,
+            scenario_results=scenario_results,
+            subsidy_results=subsidy_results,
+            borough_breakdown=borough_breakdown,
+            case_street_summary=case_street_summary,
+        )
+        self._append_dataframe_sheet(workbook, "report_headline_data", headline_df)
 
-            # Sheet 6: Property Details (sample)
-            if df_properties is not None and not df_properties.empty:
-                # Export first 1000 properties to avoid huge files
-                sample_df = df_properties.head(1000).copy()
-                sample_df.to_excel(writer, sheet_name='Property Sample', index=False)
+        # Sheet 6: Property Details (sample)
+        if df_properties is not None and not df_properties.empty:
+            # Export first 1000 properties to avoid huge files
+            self._append_dataframe_sheet(workbook, 'Property Sample', df_properties.head(1000))
 
+        workbook.save(output_path)
         logger.info(f"Excel workbook saved to: {output_path}")
 
+    @staticmethod
+    def _append_dataframe_sheet(workbook, sheet_name: str, df: pd.DataFrame, header: bool = True):
+        """Stream a DataFrame into a new sheet of a write-only openpyxl workbook."""
+        worksheet = workbook.create_sheet(title=sheet_name)
+        if header:
+            worksheet.append([str(column) for column in df.columns])
+        # Missing values must be written as empty cells; NaN/NaT are not valid xlsx values.
+        cells = df.astype(object).where(df.notna(), None)
+        for row in cells.itertuples(index=False, name=None):
+            worksheet.append(row)
+
     def _write_summary_sheet(self, writer, archetype_results: Dict, scenario_results: Dict):
         """Write executive summary sheet."""
         summary_data = []
@@ -1393,7 +1457,7 @@ class ReportGenerator:
             summary_data.append([''])
 
         df_summary = pd.DataFrame(summary_data)
-        df_summary.to_excel(writer, sheet_name='Executive Summary', index=False, header=False)
+        self._append_dataframe_sheet(writer, 'Executive Summary', df_summary, header=False)
 
     def _write_epc_bands_sheet(self, writer, epc_data: Dict):
         """Write EPC bands sheet."""
@@ -1407,7 +1471,7 @@ class ReportGenerator:
             'Percentage': [f'{p:.2f}%' for p in percentages]
         })
 
-        df_epc.to_excel(writer, sheet_name='EPC Bands', index=False)
+        self._append_dataframe_sheet(writer, 'EPC Bands', df_epc)
 
     def _write_scenarios_sheet(self, writer, scenario_results: Dict):
         """Write scenario comparison sheet."""
@@ -1484,7 +1548,7 @@ class ReportGenerator:
             })
 
         df_scenarios = pd.DataFrame(scenarios)
-        df_scenarios.to_excel(writer, sheet_name='Scenario Comparison', index=False)
+        self._append_dataframe_sheet(writer, 'Scenario Comparison', df_scenarios)
 
     def _write_subsidy_sheet(self, writer, subsidy_results: Dict):
         """Write subsidy sensitivity sheet."""
@@ -1502,11 +1566,21 @@ class ReportGenerator:
             })
 
         df_subsidy = pd.DataFrame(subsidy_data)
-        df_subsidy.to_excel(writer, sheet_name='Subsidy Sensitivity', index=False)
+        self._append_dataframe_sheet(writer, 'Subsidy Sensitivity', df_subsidy)
+
+    @staticmethod
+    def _write_xlsxwriter_sheet(workbook, sheet_name: str, df: pd.DataFrame, header_format=None):
+        """Write a DataFrame to a new xlsxwriter sheet one row at a time."""
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+        # Missing values become blank cells, as pandas' to_excel writes them.
+        cells = df.astype(object).where(df.notna(), None)
+        for row_index, row in enumerate(cells.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_index, 0, row)
 
     def _export_basic_excel(
         self,
-        writer,
+        workbook,
         archetype_results,
         scenario_results,
         subsidy_results,
@@ -1515,9 +1589,14 @@ class ReportGenerator:
         case_street_summary,
     ):
         """Basic Excel export without openpyxl formatting."""
+        header_format = workbook.add_format({'bold': True, 'border': 1})
+
         # Summary
-        pd.DataFrame([{'Analysis': 'Heat Street Project', 'Status': 'Complete'}]).to_excel(
-            writer, sheet_name='Summary', index=False
+        self._write_xlsxwriter_sheet(
+            workbook,
+            'Summary',
+            pd.DataFrame([{'Analysis': 'Heat Street Project', 'Status': 'Complete'}]),
+            header_format,
         )
 
         # Scenarios
@@ -1531,7 +1610,7 @@ class ReportGenerator:
                     'CO2 Reduction': results['annual_co2_reduction_kg'],
                     'Cost per tCO2 (20yr, £)': self._cost_per_tco2_20yr_gbp(results),
                 })
-            pd.DataFrame(scenarios).to_excel(writer, sheet_name='Scenarios', index=False)
+            self._write_xlsxwriter_sheet(workbook, 'Scenarios', pd.DataFrame(scenarios), header_format)
 
         headline_df = build_report_headline_dataframe(
             archetype_results=archetype_results,
@@ -1540,7 +1619,7 @@ class ReportGenerator:
             borough_breakdown=borough_breakdown,
             case_street_summary=case_street_summary,
         )
-        headline_df.to_excel(writer, sheet_name="report_headline_data", index=False)
+        self._write_xlsxwriter_sheet(workbook, "report_headline_data", headline_df, header_format)
 
     def plot_retrofit_readiness_dashboard(
         self,
@@ -1657,7 +1736,7 @@ class ReportGenerator:
         if save_path is None:
             save_path = self.output_dir / "retrofit_readiness_dashboard.png"
 
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         logger.info(f"✓ Saved retrofit readiness dashboard to {save_path}")
         plt.close()
 
@@ -1720,7 +1799,7 @@ class ReportGenerator:
         if save_path is None:
             save_path = self.output_dir / "fabric_cost_distribution.png"
 
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         logger.info(f"✓ Saved fabric cost distribution to {save_path}")
         plt.close()
 
@@ -1784,11 +1863,53 @@ class ReportGenerator:
         if save_path is None:
             save_path = self.output_dir / "heat_demand_scatter.png"
 
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        save_figure(save_path, dpi=300, bbox_inches='tight')
         logger.info(f"✓ Saved heat demand scatter plot to {save_path}")
         plt.close()
 
 
+# Per-process generator used when report tasks run in a ProcessPoolExecutor.
+_WORKER_GENERATOR: Optional["ReportGenerator"] = None
+
+
+def init_report_worker(outputs_dir: Optional[Path] = None):
+    """
+    Create one ReportGenerator per worker so plot styling is applied in-process.
+
+    Args:
+        outputs_dir: Run-scoped outputs directory resolved by the parent. A
+            spawned worker re-imports config and would otherwise write to the
+            public DATA_OUTPUTS_DIR, so it is redirected here as in the parent.
+    """
+    global _WORKER_GENERATOR
+    if outputs_dir is not None:
+        outputs_dir = Path(outputs_dir)
+        public_outputs = DATA_OUTPUTS_DIR
+        for module in list(sys.modules.values()):
+            if module is None:
+                continue
+            try:
+                if getattr(module, "DATA_OUTPUTS_DIR", None) == public_outputs:
+                    setattr(module, "DATA_OUTPUTS_DIR", outputs_dir)
+            except Exception:
+                continue
+    _WORKER_GENERATOR = ReportGenerator()
+
+
+def run_report_task(method_name: str, args: tuple = (), kwargs: Optional[Dict] = None, generator: Optional["ReportGenerator"] = None):
+    """
+    Call one ReportGenerator method.
+
+    Args:
+        method_name: ReportGenerator method to call
+        args: Positional arguments for the method
+        kwargs: Keyword arguments for the method
+        generator: Generator to use; defaults to the worker-process generator
+    """
+    generator = generator or _WORKER_GENERATOR or ReportGenerator()
+    return getattr(generator, method_name)(*args, **(kwargs or {}))
+
+
 def main():
     """Main execution for report generation."""
     logger.info("Starting report generation...")
@@ -1674,14 +1674,19 @@ def main():
     logger.info("Starting spatial analysis...")
 
     # Load validated data
-    input_file = DATA_PROCESSED_DIR / "epc_london_validated.csv"
+    input_file = DATA_PROCESSED_DIR / "epc_london_validated.parquet"
 
     if not input_file.exists():
-        logger.error(f"Input file not found: {input_file}")
-        return
+        input_file = DATA_PROCESSED_DIR / "epc_london_validated.csv"
+        if not input_file.exists():
+            logger.error(f"Input file not found: {input_file}")
+            return
 
     logger.info(f"Loading data from: {input_file}")
-    df = pd.read_csv(input_file)
+    if input_file.suffix == '.parquet':
+        df = pd.read_parquet(input_file)
+    else:
+        df = pd.read_csv(input_file)
 
     # Initialize analyzer
     analyzer = HeatNetworkAnalyzer()
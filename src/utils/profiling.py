@@ -170,6 +170,38 @@ def get_worker_count(default: int = 2) -> int:
         return default
 
 
+def get_max_inflight_requests(default: int = 10) -> int:
+    """
+    Get the EPC API concurrency cap from HEATSTREET_MAX_INFLIGHT env var.
+
+    Args:
+        default: Default cap if env var not set
+
+    Returns:
+        Maximum number of EPC API requests allowed in flight at once
+    """
+    try:
+        return max(1, int(os.environ.get('HEATSTREET_MAX_INFLIGHT', default)))
+    except (ValueError, TypeError):
+        return default
+
+
+def get_request_rate_limit(default: float = 0.0) -> float:
+    """
+    Get the EPC API request rate from HEATSTREET_EPC_RATE_LIMIT env var.
+
+    Args:
+        default: Default rate if env var not set
+
+    Returns:
+        Requests per second allowed across all download threads (0 disables pacing)
+    """
+    try:
+        return max(0.0, float(os.environ.get('HEATSTREET_EPC_RATE_LIMIT', default)))
+    except (ValueError, TypeError):
+        return default
+
+
 def get_chunk_size(default: int = 50000) -> int:
     """
     Get chunk size from HEATSTREET_CHUNK_SIZE env var.
@@ -61,6 +61,32 @@ def test_generate_borough_priority_ranking_creates_ranked_output(tmp_path):
     assert "TOP 10 BOROUGHS" in summary_path.read_text(encoding="utf-8")
 
 
+def test_generate_borough_breakdown_aggregates_and_picks_modal_band(tmp_path):
+    reporter = AdditionalReports()
+    df = pd.DataFrame(
+        {
+            "LOCAL_AUTHORITY": ["Camden", "Camden", "Camden", "Hackney", None, "Hackney", "Islington"],
+            "LMK_KEY": ["a", "b", "c", "d", "e", None, "g"],
+            "CURRENT_ENERGY_EFFICIENCY": [60, 70, None, 50, 40, 55, 65],
+            "ENERGY_CONSUMPTION_CURRENT": [200, 210, 220, 230, 240, 250, 260],
+            "CO2_EMISSIONS_CURRENT": [2.25, 3, 4, 5, 6, 7, 8],
+            "TOTAL_FLOOR_AREA": [80, 90, 100, 70, 60, 50, 40],
+            "CURRENT_ENERGY_RATING": ["D", "C", "C", "E", None, "D", None],
+        }
+    )
+    output_path = tmp_path / "borough_breakdown.csv"
+
+    breakdown = reporter.generate_borough_breakdown(df, output_path=output_path)
+
+    assert breakdown.index.tolist() == ["Camden", "Hackney", "Islington"]
+    assert breakdown["property_count"].tolist() == [3, 1, 1]
+    assert breakdown.loc["Camden", "mean_co2_tonnes_year"] == 3.1
+    assert breakdown.loc["Hackney", "mean_epc_rating"] == 52.5
+    assert breakdown["modal_epc_band"].tolist() == ["C", "D", "Unknown"]
+    saved = pd.read_csv(output_path)
+    assert saved.columns[0] == "LOCAL_AUTHORITY"
+
+
 def test_generate_tenure_segmentation_maps_groups_and_percentages(tmp_path):
     reporter = AdditionalReports()
     df = pd.DataFrame(
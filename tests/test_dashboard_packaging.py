@@ -65,3 +65,20 @@ def test_dashboard_cost_levers_are_config_backed(tmp_path):
     assert formatted["conservative_combined_estimate"]["high_gbp"] == configured_total * 0.8
     assert formatted["note"]
     assert all(row.get("source_note") for row in formatted["levers"])
+
+
+def test_write_dataset_emits_valid_json_for_numpy_and_non_finite_values(tmp_path):
+    import numpy as np
+
+    builder = DashboardDataBuilder(output_dir=tmp_path)
+    dataset = {
+        "summaryStats": {"totalProperties": np.int64(3), "meanSap": float("nan")},
+        "tiers": {1: "Tier 1"},
+    }
+
+    output_path = builder.write_dataset(dataset)
+
+    payload = json.loads(output_path.read_text(encoding="utf-8"))
+    assert payload["summaryStats"]["totalProperties"] == 3
+    assert payload["summaryStats"]["meanSap"] is None
+    assert payload["tiers"] == {"1": "Tier 1"}
@@ -4,7 +4,7 @@ from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.cleaning.data_validator import EPCDataValidator
+from src.cleaning.data_validator import EPCDataValidator, filter_properties
 
 
 def test_negative_energy_and_co2_rows_removed():
@@ -68,3 +68,87 @@ def test_negative_energy_and_co2_rows_removed():
     assert (df_validated['ENERGY_CONSUMPTION_CURRENT'] < 0).sum() == 0
     assert (df_validated['CO2_EMISSIONS_CURRENT'] < 0).sum() == 0
 
+
+def test_remove_duplicates_keeps_most_recent_certificate_per_uprn():
+    df = pd.DataFrame({
+        'LMK_KEY': ['OLD', 'NEW', 'OTHER'],
+        'UPRN': ['100', '100', '200'],
+        'LODGEMENT_DATE': ['2019-05-01', '2023-05-01', '2021-01-01'],
+    })
+
+    validator = EPCDataValidator()
+    deduped = validator.remove_duplicates(df)
+
+    assert sorted(deduped['LMK_KEY']) == ['NEW', 'OTHER']
+    assert validator.validation_report['duplicates_removed'] == 1
+
+
+def test_remove_duplicates_keeps_mixed_type_keys_distinct():
+    df = pd.DataFrame({
+        'LMK_KEY': ['INT', 'STR'],
+        'UPRN': pd.Series([123, '123'], dtype=object),
+        'LODGEMENT_DATE': ['2023-05-01', '2022-05-01'],
+    })
+
+    deduped = EPCDataValidator().remove_duplicates(df)
+
+    assert sorted(deduped['LMK_KEY']) == ['INT', 'STR']
+
+
+def test_validate_dataset_leaves_shallow_copied_input_unchanged():
+    raw = pd.DataFrame({
+        'lmk-key': ['A', 'B'],
+        'uprn': ['100', '200'],
+        'lodgement-date': ['2023-01-01', '2023-02-01'],
+        'total-floor-area': [85.0, 1.0],
+        'energy-consumption-current': [150.0, -5.0],
+    })
+    df_raw = raw.copy(deep=False)
+    snapshot = raw.copy()
+
+    EPCDataValidator().validate_dataset(raw)
+
+    pd.testing.assert_frame_equal(df_raw, snapshot)
+
+
+def test_roof_insulation_thickness_parsed_from_descriptions():
+    df = pd.DataFrame({
+        'ROOF_DESCRIPTION': [
+            'Pitched, 270 mm loft insulation',
+            'Pitched, no insulation (assumed)',
+            'Roof room(s), 0mm',
+            'Pitched, 12mm loft insulation, 300 mm',
+            'Pitched, 400+ mm loft insulation',
+            None,
+        ],
+    })
+
+    result = EPCDataValidator()._standardize_roof_insulation(df)
+
+    thickness = result['roof_insulation_thickness_mm']
+    assert thickness.iloc[:4].tolist() == [270.0, 0.0, 0.0, 12.0]
+    assert thickness.iloc[4:].isna().all()
+    assert result['roof_insulation_category'].tolist() == [
+        'excellent', 'none', 'none', 'minimal', 'unknown', 'unknown',
+    ]
+
+
+def test_filter_properties_combines_criteria_and_leaves_input_unchanged():
+    df = pd.DataFrame({
+        'tenure': ['owner_occupied', 'social', 'owner_occupied', None],
+        'CURRENT_ENERGY_RATING': ['D', 'E', 'B', 'F'],
+        'CONSTRUCTION_AGE_BAND': ['before 1900', '1900-1929', '1900-1929', '1950-1966'],
+        'wall_insulated': pd.array([False, False, False, pd.NA], dtype='boolean'),
+    })
+    original = df.copy()
+
+    filtered = filter_properties(
+        df,
+        tenure='owner_occupied',
+        epc_band_range=('D', 'G'),
+        year_built_range=(1900, 1930),
+        has_wall_insulation=False,
+    )
+
+    assert filtered.index.tolist() == [0]
+    pd.testing.assert_frame_equal(df, original)
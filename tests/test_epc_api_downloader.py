@@ -1,5 +1,6 @@
 import io
 import json
+import os
 import re
 import shutil
 import ssl
@@ -316,16 +317,23 @@ def test_apply_edwardian_filters_keeps_only_pre_1930_terraced_houses():
             },
             {
                 "UPRN": "keep_end",
-                "PROPERTY_TYPE": "House",
+                "PROPERTY_TYPE": " house ",
                 "BUILT_FORM": "Enclosed End-Terrace",
                 "CONSTRUCTION_AGE_BAND": "before 1900",
             },
+            {
+                "UPRN": "drop_missing_form",
+                "PROPERTY_TYPE": "House",
+                "BUILT_FORM": None,
+                "CONSTRUCTION_AGE_BAND": "before 1900",
+            },
         ]
-    )
+    ).rename(columns={"BUILT_FORM": "built-form"})
 
     filtered = downloader.apply_edwardian_filters(df)
 
     assert filtered["UPRN"].tolist() == ["keep_mid", "keep_end"]
+    assert "built-form" in df.columns
 
 
 def test_apply_edwardian_filters_raises_if_required_columns_missing():
@@ -358,6 +366,42 @@ def test_save_data_rejects_filtered_output_identical_to_raw_when_stock_columns_m
     assert not (output_dir / "epc_london_filtered.csv").exists()
 
 
+def test_save_data_writes_csv_and_zstd_parquet(monkeypatch, tmp_path):
+    downloader = EPCAPIDownloader(token="abc123")
+    monkeypatch.setattr("src.acquisition.epc_api_downloader.DATA_RAW_DIR", tmp_path)
+
+    df = pd.DataFrame(
+        {
+            "LMK_KEY": ["A", "B"],
+            "LOCAL_AUTHORITY_LABEL": ["Camden", "Hackney"],
+            "TOTAL_FLOOR_AREA": [85.5, None],
+        }
+    )
+
+    downloader.save_data(df, "epc_london_raw.csv")
+
+    csv_round_trip = pd.read_csv(tmp_path / "epc_london_raw.csv")
+    parquet_round_trip = pd.read_parquet(tmp_path / "epc_london_raw.parquet")
+    assert csv_round_trip["LMK_KEY"].tolist() == ["A", "B"]
+    assert csv_round_trip["TOTAL_FLOOR_AREA"].isna().tolist() == [False, True]
+    assert parquet_round_trip["LOCAL_AUTHORITY_LABEL"].tolist() == ["Camden", "Hackney"]
+
+
+def test_save_data_parquet_keeps_nulls_in_mixed_object_columns(monkeypatch, tmp_path):
+    downloader = EPCAPIDownloader(token="abc123")
+    monkeypatch.setattr("src.acquisition.epc_api_downloader.DATA_RAW_DIR", tmp_path)
+
+    df = pd.DataFrame({"UPRN": [100023, "100024", None], "POSTCODE": ["NW1 0AA", None, "E8 1AA"]})
+
+    downloader.save_data(df, "epc_london_raw.csv")
+
+    parquet_round_trip = pd.read_parquet(tmp_path / "epc_london_raw.parquet")
+    assert parquet_round_trip["UPRN"].tolist()[:2] == ["100023", "100024"]
+    assert parquet_round_trip["UPRN"].isna().tolist() == [False, False, True]
+    assert parquet_round_trip["POSTCODE"].isna().tolist() == [False, True, False]
+    assert df["UPRN"].tolist()[0] == 100023
+
+
 def test_download_all_london_boroughs_fails_fast_with_borough_context(monkeypatch):
     downloader = EPCAPIDownloader(token="abc123")
     attempted_boroughs = []
@@ -381,6 +425,7 @@ def test_download_all_london_boroughs_fails_fast_with_borough_context(monkeypatc
             property_types=["house"],
             sample_start_date=date_cls(2024, 1, 1),
             sample_end_date=date_cls(2024, 12, 31),
+            max_workers=1,
         )
 
     error = exc_info.value
@@ -422,6 +467,20 @@ def test_download_borough_data_distinguishes_network_failures(monkeypatch):
     assert "Camden" in str(error)
 
 
+def test_apply_sample_window_filter_keeps_whole_end_day_and_falls_back_to_inspection_date():
+    downloader = EPCAPIDownloader(token="abc123")
+    df = pd.DataFrame(
+        {
+            "LODGEMENT_DATE": ["2024-01-01", "2024-12-31 23:59:00", "2025-01-01", "not a date", None],
+            "INSPECTION_DATE": [None, None, None, None, "2024-06-01"],
+        }
+    )
+
+    filtered = downloader._apply_sample_window_filter(df, date_cls(2024, 1, 1), date_cls(2024, 12, 31))
+
+    assert filtered.index.tolist() == [0, 1, 4]
+
+
 def test_download_national_domestic_dataset_ignores_recommendations_and_prunes_years(monkeypatch, tmp_path):
     output_dir = tmp_path / "staged_national_ingest"
     output_dir.mkdir(exist_ok=True)
@@ -438,8 +497,8 @@ def test_download_national_domestic_dataset_ignores_recommendations_and_prunes_y
         )
         zf.writestr(
             "certificates-2024.csv",
-            "uprn,lodgement-date,council,property-type,propertyTypeDescription,builtForm,constructionAgeBand\n"
-            "keep,2024-01-01,Camden,house,House,Mid-Terrace,England and Wales: 1900-1929\n",
+            "uprn,lodgement-date,council,postcode,property-type,propertyTypeDescription,builtForm,constructionAgeBand\n"
+            "keep,2024-01-01,Camden,,house,House,Mid-Terrace,England and Wales: 1900-1929\n",
         )
         zf.writestr(
             "recommendations-2024.csv",
@@ -481,6 +540,23 @@ def test_download_national_domestic_dataset_ignores_recommendations_and_prunes_y
     assert dataset.metadata["selected_certificate_members"] == ["certificates-2024.csv"]
     assert dataset.metadata["ignored_recommendation_members"] == ["recommendations-2024.csv"]
     assert "certificates-2014.csv" in dataset.metadata["ignored_non_certificate_members"]
+    # Blank text fields stay null in the staged parts instead of becoming "nan".
+    assert dataset.load_dataframe()["POSTCODE"].isna().tolist() == [True]
+
+
+def test_full_load_text_dtypes_map_raw_headers_for_descriptive_columns():
+    csv_bytes = io.BytesIO()
+    with zipfile.ZipFile(csv_bytes, "w") as zf:
+        zf.writestr(
+            "certificates-2024.csv",
+            "uprn,postcode,current-energy-rating,builtForm,total-floor-area\n"
+            "1,01234,D,Mid-Terrace,80.5\n",
+        )
+
+    with zipfile.ZipFile(csv_bytes) as zf:
+        dtypes = EPCAPIDownloader._full_load_text_dtypes(zf, "certificates-2024.csv")
+
+    assert dtypes == {"postcode": "string", "current-energy-rating": "string", "builtForm": "string"}
 
 
 def test_download_national_domestic_dataset_counts_skipped_malformed_rows(monkeypatch, tmp_path):
@@ -937,3 +1013,249 @@ def test_download_borough_data_treats_terminal_out_of_range_page_as_end_of_pagin
 
     assert len(df) == 13
     assert requested_pages == list(range(1, 15))
+
+
+def test_download_all_london_boroughs_parallel_search_keeps_borough_order(monkeypatch):
+    downloader = EPCAPIDownloader(token="abc123")
+
+    def fake_download_borough_data(borough_name, property_type="house", **kwargs):
+        return pd.DataFrame([{"COUNCIL": borough_name, "PROPERTY_TYPE": property_type}])
+
+    monkeypatch.setattr(downloader, "download_borough_data", fake_download_borough_data)
+
+    df = downloader.download_all_london_boroughs(property_types=["house"], max_workers=4)
+
+    assert df["COUNCIL"].tolist() == list(EPCAPIDownloader.LONDON_LA_CODES)
+
+
+def test_download_all_london_boroughs_shares_one_progress_bar(monkeypatch):
+    downloader = EPCAPIDownloader(token="abc123")
+    progress_bars = []
+
+    def fake_download_borough_data(borough_name, property_type="house", **kwargs):
+        progress_bars.append(kwargs["progress_bar"])
+        return pd.DataFrame([{"COUNCIL": borough_name}])
+
+    monkeypatch.setattr(downloader, "download_borough_data", fake_download_borough_data)
+
+    downloader.download_all_london_boroughs(property_types=["house"], max_workers=4, log_boroughs=False)
+
+    assert len(progress_bars) == len(EPCAPIDownloader.LONDON_LA_CODES)
+    assert len({id(bar) for bar in progress_bars}) == 1
+
+
+def test_download_all_london_boroughs_forwards_search_cache_choice(monkeypatch):
+    downloader = EPCAPIDownloader(token="abc123")
+    cache_choices = set()
+
+    def fake_download_borough_data(borough_name, property_type="house", **kwargs):
+        cache_choices.add(kwargs["use_search_cache"])
+        return pd.DataFrame([{"COUNCIL": borough_name}])
+
+    monkeypatch.setattr(downloader, "download_borough_data", fake_download_borough_data)
+
+    downloader.download_all_london_boroughs(max_workers=1, log_boroughs=False, use_search_cache=True)
+
+    assert cache_choices == {True}
+
+
+def test_download_borough_data_reuses_search_cache_until_expired(monkeypatch, tmp_path):
+    monkeypatch.setattr("src.acquisition.epc_api_downloader.DATA_RAW_DIR", tmp_path / "search_cache")
+    downloader = EPCAPIDownloader(token="abc123", use_search_cache=True)
+    requested_pages = []
+
+    def fake_request_json(url, params, retries=6, request_context=None):
+        requested_pages.append(params["current_page"])
+        return {
+            "data": [{"certificateNumber": "1", "council": "Camden", "registrationDate": "2024-01-01"}],
+            "pagination": {},
+        }
+
+    monkeypatch.setattr(downloader, "_request_json", fake_request_json)
+
+    first = downloader.download_borough_data("Camden", show_progress=False)
+    second = downloader.download_borough_data("Camden", show_progress=False)
+
+    assert requested_pages == [1]
+    pd.testing.assert_frame_equal(first, second)
+
+    (cache_file,) = (tmp_path / "search_cache" / "_cache").glob("*.parquet")
+    expired = cache_file.stat().st_mtime - (EPCAPIDownloader.SEARCH_CACHE_TTL_DAYS + 1) * 86400
+    os.utime(cache_file, (expired, expired))
+    downloader.download_borough_data("Camden", show_progress=False)
+
+    assert requested_pages == [1, 1]
+
+
+def test_request_json_caps_concurrent_requests(monkeypatch):
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import src.acquisition.epc_api_downloader as epc_module
+
+    downloader = EPCAPIDownloader(token="abc123")
+    monkeypatch.setattr(epc_module, "_INFLIGHT_REQUESTS", threading.BoundedSemaphore(2))
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    class FakeResponse(io.BytesIO):
+        def __exit__(self, *exc):
+            with lock:
+                in_flight.pop()
+            return super().__exit__(*exc)
+
+    def fake_urlopen(request, timeout=60, context=None):
+        with lock:
+            in_flight.append(request)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        return FakeResponse(b'{"data": []}')
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        payloads = list(executor.map(lambda _: downloader._request_json("https://example.test", {}), range(6)))
+
+    assert payloads == [{"data": []}] * 6
+    assert max(peak) <= 2
+
+
+def test_request_json_shares_rate_limit_pauses_across_requests(monkeypatch):
+    import email.message
+
+    import src.acquisition.epc_api_downloader as epc_module
+
+    class RecordingLimiter:
+        def __init__(self):
+            self.acquired = 0
+            self.pauses = []
+
+        def acquire(self):
+            self.acquired += 1
+
+        def pause(self, seconds):
+            self.pauses.append(seconds)
+
+    limiter = RecordingLimiter()
+    monkeypatch.setattr(epc_module, "_REQUEST_RATE_LIMITER", limiter)
+    downloader = EPCAPIDownloader(token="abc123")
+    retry_headers = email.message.Message()
+    retry_headers["Retry-After"] = "7"
+    quota_headers = email.message.Message()
+    quota_headers["X-RateLimit-Remaining"] = "0"
+    responses = [
+        urllib.error.HTTPError("https://example.test", 429, "Too Many Requests", retry_headers, io.BytesIO(b"")),
+        urllib.error.HTTPError("https://example.test", 429, "Too Many Requests", email.message.Message(), io.BytesIO(b"")),
+    ]
+
+    class FakeResponse(io.BytesIO):
+        headers = quota_headers
+
+    def fake_urlopen(request, timeout=60, context=None):
+        if responses:
+            raise responses.pop(0)
+        return FakeResponse(b'{"data": [1]}')
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+
+    assert downloader._request_json("https://example.test", {}) == {"data": [1]}
+    assert limiter.acquired == 3
+    # Retry-After first, exponential backoff second, then the exhausted-quota pause.
+    assert limiter.pauses == [7.0, 2.0, 1.0]
+
+
+def test_request_json_retries_transient_server_errors_and_timeouts(monkeypatch):
+    import email.message
+
+    import src.acquisition.epc_api_downloader as epc_module
+
+    class RecordingLimiter:
+        def __init__(self):
+            self.pauses = []
+
+        def acquire(self):
+            pass
+
+        def pause(self, seconds):
+            self.pauses.append(seconds)
+
+    limiter = RecordingLimiter()
+    sleeps = []
+    monkeypatch.setattr(epc_module, "_REQUEST_RATE_LIMITER", limiter)
+    monkeypatch.setattr(epc_module.time, "sleep", sleeps.append)
+    downloader = EPCAPIDownloader(token="abc123")
+    failures = [
+        urllib.error.HTTPError("https://example.test", 503, "Service Unavailable", email.message.Message(), io.BytesIO(b"")),
+        TimeoutError("read timed out"),
+        urllib.error.URLError(TimeoutError("connect timed out")),
+    ]
+
+    def fake_urlopen(request, timeout=60, context=None):
+        if failures:
+            raise failures.pop(0)
+        return io.BytesIO(b'{"data": [1]}')
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+
+    assert downloader._request_json("https://example.test", {}) == {"data": [1]}
+    assert limiter.pauses == [1.0]
+    assert sleeps == [2.0, 4.0]
+
+
+def test_request_rate_limiter_paces_calls_to_the_configured_rate():
+    import time
+
+    from src.acquisition.epc_api_downloader import _RequestRateLimiter
+
+    limiter = _RequestRateLimiter(rate=50.0, capacity=1.0)
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.acquire()
+    # One token is available up front; the remaining three wait ~20 ms each.
+    assert time.monotonic() - start >= 0.05
+
+
+def test_request_json_reuses_tls_context_and_accepts_gzip(monkeypatch):
+    import email.message
+    import gzip
+
+    downloader = EPCAPIDownloader(token="abc123")
+    contexts = []
+    monkeypatch.setattr(
+        EPCAPIDownloader,
+        "_create_ssl_context",
+        staticmethod(lambda: contexts.append(object()) or contexts[-1]),
+    )
+    gzip_headers = email.message.Message()
+    gzip_headers["Content-Encoding"] = "gzip"
+    seen = []
+
+    class FakeResponse(io.BytesIO):
+        headers = gzip_headers
+
+    def fake_urlopen(request, timeout=60, context=None):
+        seen.append((request.get_header("Accept-encoding"), context))
+        return FakeResponse(gzip.compress(b'{"data": [1, 2]}'))
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+
+    assert downloader._request_json("https://example.test", {}) == {"data": [1, 2]}
+    assert downloader._request_json("https://example.test", {}) == {"data": [1, 2]}
+    assert len(contexts) == 1
+    assert seen == [("gzip", contexts[0])] * 2
+
+
+def test_request_json_wraps_malformed_json_body_with_request_context(monkeypatch):
+    downloader = EPCAPIDownloader(token="abc123")
+    context = downloader._build_request_context("Camden", "house", None, None)
+    monkeypatch.setattr(
+        "urllib.request.urlopen",
+        lambda request, timeout=60, context=None: io.BytesIO(b'{"data": ['),
+    )
+
+    with pytest.raises(EPCDownloadError) as exc_info:
+        downloader._request_json("https://example.test", {}, request_context=context)
+
+    assert exc_info.value.borough_name == "Camden"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import copy
 import csv
+import os
 
 import geopandas as gpd
 from shapely.geometry import Point
@@ -132,6 +133,50 @@ def test_existing_invalid_hnpd_file_is_not_reported_as_available(tmp_path):
     )
 
 
+def test_hnpd_rows_are_parsed_once_until_the_csv_changes(tmp_path, monkeypatch):
+    csv_path = tmp_path / "hnpd.csv"
+    row = ["1", "London", "Operational", "Operational", "536540", "176850", "Scheme"]
+    _write_hnpd_csv(csv_path, [row])
+    downloader = HNPDDownloader(_test_config(csv_path.name), external_dir=tmp_path)
+
+    parse_calls = []
+    original_parse_rows = HNPDDownloader._parse_rows
+
+    def counting_parse_rows(self):
+        parse_calls.append(self.csv_path)
+        return original_parse_rows(self)
+
+    monkeypatch.setattr(HNPDDownloader, "_parse_rows", counting_parse_rows)
+
+    assert downloader.get_data_summary()["total_records"] == 1
+    assert len(downloader.get_tier_1_networks(region="London")) == 1
+    assert len(parse_calls) == 1
+
+    _write_hnpd_csv(csv_path, [row, ["2", *row[1:6], "Second scheme"]])
+
+    assert downloader.get_data_summary()["total_records"] == 2
+    assert len(parse_calls) == 2
+
+
+def test_cached_hnpd_rows_and_hash_reflect_the_file_on_disk(tmp_path):
+    csv_path = tmp_path / "hnpd.csv"
+    row = ["1", "London", "Operational", "Operational", "536540", "176850", "Scheme A"]
+    _write_hnpd_csv(csv_path, [row])
+    downloader = HNPDDownloader(_test_config(csv_path.name), external_dir=tmp_path)
+
+    loaded = downloader.load_hnpd_csv()
+    loaded[0]["Site Name"] = "edited by caller"
+    assert downloader.load_hnpd_csv()[0]["Site Name"] == "Scheme A"
+
+    first_hash = downloader.validate_hnpd_file()["sha256"]
+    stat = csv_path.stat()
+    _write_hnpd_csv(csv_path, [[*row[:6], "Scheme B"]])
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert csv_path.stat().st_size == stat.st_size
+
+    assert downloader.validate_hnpd_file()["sha256"] != first_hash
+
+
 def test_hnpd_points_assign_properties_to_configured_proximity_tiers():
     config = copy.deepcopy(load_config())
     config.setdefault("spatial", {})["disable"] = True
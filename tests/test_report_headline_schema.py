@@ -78,3 +78,106 @@ def test_report_headline_dataframe_includes_required_keys():
             & (dataframe["metric_key"] == "scenario_carbon_abatement_cost_median")
         ].iloc[0]
         assert "Diagnostic property-level median" in diagnostic_row["definition"]
+
+
+def test_export_to_excel_streams_sheets_and_blanks_missing_values(tmp_path):
+    import openpyxl
+
+    from src.reporting.visualizations import ReportGenerator
+
+    archetype_results = {
+        "epc_bands": {
+            "total": 2,
+            "frequency": {"D": 1, "E": 1},
+            "percentage": {"D": 50.0, "E": 50.0},
+        },
+        "sap_scores": {"mean": 55.5, "median": 54.0},
+    }
+    properties = pd.DataFrame({"UPRN": ["1", "2"], "TOTAL_FLOOR_AREA": [85.0, float("nan")]})
+    output_path = tmp_path / "results.xlsx"
+
+    ReportGenerator().export_to_excel(
+        archetype_results,
+        {},
+        df_properties=properties,
+        output_path=output_path,
+    )
+
+    workbook = openpyxl.load_workbook(output_path)
+    assert workbook.sheetnames == ["Executive Summary", "EPC Bands", "report_headline_data", "Property Sample"]
+    sample_rows = list(workbook["Property Sample"].iter_rows(values_only=True))
+    assert sample_rows == [("UPRN", "TOTAL_FLOOR_AREA"), ("1", 85), ("2", None)]
+    workbook.close()
+
+
+def test_export_to_excel_falls_back_to_xlsxwriter_rows(tmp_path, monkeypatch):
+    import sys
+
+    import openpyxl
+
+    from src.reporting.visualizations import ReportGenerator
+
+    output_path = tmp_path / "results_basic.xlsx"
+    monkeypatch.setitem(sys.modules, "openpyxl", None)
+
+    ReportGenerator().export_to_excel({}, {}, output_path=output_path)
+
+    monkeypatch.undo()
+    workbook = openpyxl.load_workbook(output_path)
+    assert workbook.sheetnames == ["Summary", "report_headline_data"]
+    summary_rows = list(workbook["Summary"].iter_rows(values_only=True))
+    assert summary_rows == [("Analysis", "Status"), ("Heat Street Project", "Complete")]
+    assert workbook["Summary"]["A1"].font.bold
+    workbook.close()
+
+
+def test_save_figure_writes_png_and_vector_outputs(tmp_path):
+    import matplotlib.pyplot as plt
+
+    from src.reporting.visualizations import save_figure
+
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    png_path = tmp_path / "chart.png"
+    svg_path = tmp_path / "chart.svg"
+
+    save_figure(png_path, fig, dpi=50)
+    save_figure(svg_path, fig)
+    plt.close(fig)
+
+    assert png_path.read_bytes().startswith(b"\x89PNG\r\n\x1a\n")
+    assert svg_path.read_text(encoding="utf-8").lstrip().startswith("<?xml")
+
+
+def test_report_datapoints_export_renames_tier_summary_columns(tmp_path, monkeypatch):
+    import src.reporting.visualizations as visualizations
+
+    monkeypatch.setattr(visualizations, "DATA_OUTPUTS_DIR", tmp_path)
+    tier_summary = pd.DataFrame.from_records(
+        [("Tier 5", 12, 100.0, "Heat Pump", "extra")],
+        columns=["Tier", "Property Count", "Percentage", "Recommended Pathway", "Notes"],
+    )
+
+    output_path = visualizations.ReportGenerator()._export_report_datapoints({}, {}, tier_summary)
+
+    tiers = pd.read_excel(output_path, sheet_name="Heat Network Tiers")
+    assert tiers.to_dict("records") == [
+        {"tier": "Tier 5", "property_count": 12, "percentage": 100.0, "recommended_pathway": "Heat Pump"}
+    ]
+
+
+def test_plot_sap_score_distribution_accepts_pre_binned_summary(tmp_path):
+    import numpy as np
+
+    from src.reporting.visualizations import ReportGenerator
+
+    scores = np.array([35.0, 48.0, 55.0, 61.0, 61.0, 72.0])
+    summary = ReportGenerator.summarize_sap_scores(scores, bins=5)
+
+    assert summary["counts"].sum() == len(scores)
+    assert len(summary["edges"]) == 6
+    assert summary["median"] == 58.0
+
+    save_path = tmp_path / "sap.png"
+    ReportGenerator().plot_sap_score_distribution(summary, save_path=save_path)
+    assert save_path.read_bytes().startswith(b"\x89PNG")
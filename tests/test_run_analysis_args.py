@@ -87,3 +87,26 @@ def test_dashboard_factory_honors_tui_env_overrides():
     args = run_analysis.parse_args(["--simple-tui"])
     ui = create_dashboard(args, console=console, env={"TERM": "dumb"})
     assert isinstance(ui, SimpleDashboard)
+
+
+def test_open_results_folder_launches_file_manager_without_waiting(monkeypatch):
+    launched = []
+
+    class FakePopen:
+        def __init__(self, args, **kwargs):
+            launched.append((args, kwargs))
+
+    monkeypatch.setattr(run_analysis.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(run_analysis.subprocess, "Popen", FakePopen)
+    monkeypatch.setattr(
+        run_analysis.subprocess,
+        "run",
+        lambda *args, **kwargs: pytest.fail("opening results should not block on subprocess.run"),
+    )
+
+    run_analysis.open_results_folder()
+
+    assert len(launched) == 1
+    args, kwargs = launched[0]
+    assert args == ["xdg-open", "data/outputs"]
+    assert kwargs["start_new_session"] is True
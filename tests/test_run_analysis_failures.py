@@ -304,6 +304,199 @@ def test_download_data_single_borough_uses_full_load_stock_source(monkeypatch):
     assert "Filtered Camden pre-1930 terraced house records: 1" in output
 
 
+def _setup_reusable_camden_subset(monkeypatch, sample_start, sample_end, fake_console):
+    data_dir = Path(".tmp_existing_stock_check") / "borough_reuse"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    subset_path = data_dir / "epc_camden_filtered.parquet"
+    pd.DataFrame(
+        [
+            {
+                "UPRN": "1",
+                "COUNCIL": "Camden",
+                "PROPERTY_TYPE": "House",
+                "BUILT_FORM": "Mid-Terrace",
+                "CONSTRUCTION_AGE_BAND": "England and Wales: 1900-1929",
+            }
+        ]
+    ).to_parquet(subset_path, index=False)
+    run_analysis.write_sample_window_metadata(subset_path, sample_start, sample_end, "filtered_epc_download")
+
+    class FakeDownloader:
+        LONDON_LA_CODES = {"Camden": "E09000007"}
+        get_missing_stock_definition_columns = staticmethod(lambda df: [])
+        downloads = []
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def download_borough_data(self, borough_name, **kwargs):
+            self.__class__.downloads.append(borough_name)
+            return pd.DataFrame()
+
+    monkeypatch.setattr(run_analysis, "console", fake_console)
+    monkeypatch.setattr(run_analysis, "DATA_RAW_DIR", data_dir)
+    monkeypatch.setattr(run_analysis, "EPCAPIDownloader", FakeDownloader)
+    return FakeDownloader
+
+
+def _fail_prompt(*args, **kwargs):
+    raise AssertionError("a fully specified CLI run must not prompt")
+
+
+def test_download_data_reuses_matching_borough_subset_without_downloading(monkeypatch):
+    sample_start = date_cls(2024, 1, 1)
+    sample_end = date_cls(2024, 12, 31)
+    fake_console = FakeConsole()
+    downloader_cls = _setup_reusable_camden_subset(monkeypatch, sample_start, sample_end, fake_console)
+    monkeypatch.setattr(run_analysis.questionary, "confirm", _fail_prompt)
+
+    result = run_analysis.download_data(
+        sample_start_date=sample_start,
+        sample_end_date=sample_end,
+        download_scope="single-borough",
+        borough="Camden",
+        use_existing=True,
+    )
+
+    assert result["UPRN"].tolist() == ["1"]
+    assert downloader_cls.downloads == []
+    assert "Reusing filtered Camden pre-1930 terraced house records: 1" in "\n".join(fake_console.messages)
+
+
+def test_download_data_offers_borough_subset_reuse_when_borough_chosen_interactively(monkeypatch):
+    sample_start = date_cls(2024, 1, 1)
+    sample_end = date_cls(2024, 12, 31)
+    downloader_cls = _setup_reusable_camden_subset(monkeypatch, sample_start, sample_end, FakeConsole())
+    monkeypatch.setattr(run_analysis.questionary, "autocomplete", lambda *args, **kwargs: DummyPrompt("Camden"))
+    monkeypatch.setattr(run_analysis.questionary, "confirm", lambda *args, **kwargs: DummyPrompt(True))
+
+    result = run_analysis.download_data(
+        sample_start_date=sample_start,
+        sample_end_date=sample_end,
+        download_scope="single-borough",
+    )
+
+    assert result["UPRN"].tolist() == ["1"]
+    assert downloader_cls.downloads == []
+
+
+@pytest.mark.parametrize("fresh", [False, True])
+def test_download_data_downloads_borough_again_without_prompting_for_cli_runs(monkeypatch, fresh):
+    sample_start = date_cls(2024, 1, 1)
+    sample_end = date_cls(2024, 12, 31)
+    downloader_cls = _setup_reusable_camden_subset(monkeypatch, sample_start, sample_end, FakeConsole())
+    monkeypatch.setattr(run_analysis.questionary, "confirm", _fail_prompt)
+    if fresh:
+        monkeypatch.setattr(run_analysis, "_find_reusable_borough_subset", _fail_prompt)
+
+    run_analysis.download_data(
+        sample_start_date=sample_start,
+        sample_end_date=sample_end,
+        download_scope="single-borough",
+        borough="Camden",
+        fresh=fresh,
+    )
+
+    assert downloader_cls.downloads == ["Camden"]
+
+
+def test_count_csv_records_handles_missing_trailing_newline():
+    data_dir = Path(".tmp_existing_stock_check")
+    data_dir.mkdir(exist_ok=True)
+    with_newline = data_dir / "with_newline.csv"
+    without_newline = data_dir / "without_newline.csv"
+    header_only = data_dir / "header_only.csv"
+    with_newline.write_bytes(b"UPRN,COUNCIL\n1,Camden\n2,Hackney\n")
+    without_newline.write_bytes(b"UPRN,COUNCIL\n1,Camden\n2,Hackney")
+    header_only.write_bytes(b"UPRN,COUNCIL\n")
+
+    assert run_analysis.count_csv_records(with_newline) == 2
+    assert run_analysis.count_csv_records(without_newline, chunk_size=4) == 2
+    assert run_analysis.count_csv_records(header_only) == 0
+
+
+def test_load_existing_data_reads_saved_csv(monkeypatch):
+    fake_console = FakeConsole()
+    data_dir = Path(".tmp_existing_stock_check")
+    data_dir.mkdir(exist_ok=True)
+    csv_path = data_dir / "epc_london_filtered.csv"
+    csv_path.write_text(
+        "UPRN,LODGEMENT_DATE,TOTAL_FLOOR_AREA\n1,2023-01-01,85.5\n2,2023-02-01,\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(run_analysis, "console", fake_console)
+
+    df = run_analysis.load_existing_data(csv_path)
+
+    assert df["UPRN"].tolist() == [1, 2]
+    assert df["LODGEMENT_DATE"].tolist() == ["2023-01-01", "2023-02-01"]
+    assert df["TOTAL_FLOOR_AREA"].isna().tolist() == [False, True]
+
+
+def test_read_existing_csv_treats_na_tokens_like_pandas():
+    data_dir = Path(".tmp_existing_stock_check") / "na_tokens"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = data_dir / "epc_london_filtered.csv"
+    csv_path.write_text(
+        "UPRN,WALLS_DESCRIPTION,MAINHEAT_DESCRIPTION,TOTAL_FLOOR_AREA\n"
+        "1,Solid brick,,85.5\n"
+        "2,NA,Boiler,\n"
+        '3,N/A,"",70\n',
+        encoding="utf-8",
+    )
+
+    df = run_analysis._read_existing_csv(csv_path)
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(csv_path))
+
+
+def test_read_existing_csv_keeps_iso_datetime_text_like_pandas():
+    data_dir = Path(".tmp_existing_stock_check") / "iso_datetimes"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = data_dir / "epc_london_filtered.csv"
+    csv_path.write_text(
+        "UPRN,LODGEMENT_DATE,LODGEMENT_DATETIME\n"
+        "1,2023-05-01,2023-05-01T10:00:00\n"
+        "2,2023-06-01,2023-06-01 10:00:00.123456\n",
+        encoding="utf-8",
+    )
+
+    df = run_analysis._read_existing_csv(csv_path)
+
+    pd.testing.assert_frame_equal(df, pd.read_csv(csv_path))
+    assert df["LODGEMENT_DATETIME"].tolist() == ["2023-05-01T10:00:00", "2023-06-01 10:00:00.123456"]
+
+
+def test_load_existing_data_reuses_parquet_snapshot_until_csv_changes(monkeypatch):
+    monkeypatch.setattr(run_analysis, "console", FakeConsole())
+    data_dir = Path(".tmp_existing_stock_check") / "snapshot"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = data_dir / "epc_london_filtered.csv"
+    csv_path.write_text("UPRN,COUNCIL\n1,Camden\n", encoding="utf-8")
+    (data_dir / "epc_london_filtered.snapshot.parquet").unlink(missing_ok=True)
+
+    first = run_analysis.load_existing_data(csv_path)
+    assert (data_dir / "epc_london_filtered.snapshot.parquet").is_file()
+
+    def fail_csv_read(path):
+        raise AssertionError("unchanged CSV should be served from the snapshot")
+
+    monkeypatch.setattr(run_analysis, "_read_existing_csv", fail_csv_read)
+    cached = run_analysis.load_existing_data(csv_path)
+    pd.testing.assert_frame_equal(first, cached)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(run_analysis, "console", FakeConsole())
+    csv_path.write_text("UPRN,COUNCIL\n1,Camden\n2,Hackney\n", encoding="utf-8")
+    refreshed = run_analysis.load_existing_data(csv_path)
+    assert refreshed["COUNCIL"].tolist() == ["Camden", "Hackney"]
+
+    monkeypatch.setattr(run_analysis, "CSV_SNAPSHOT_READER_VERSION", run_analysis.CSV_SNAPSHOT_READER_VERSION + 1)
+    monkeypatch.setattr(run_analysis, "_read_existing_csv", lambda path: refreshed.assign(COUNCIL="re-read"))
+    reread = run_analysis.load_existing_data(csv_path)
+    assert reread["COUNCIL"].tolist() == ["re-read", "re-read"]
+
+
 def test_check_existing_data_ignores_filtered_file_missing_stock_columns(monkeypatch):
     fake_console = FakeConsole()
     data_dir = Path(".tmp_existing_stock_check")
@@ -321,6 +514,91 @@ def test_check_existing_data_ignores_filtered_file_missing_stock_columns(monkeyp
     assert "Existing Filtered Data Ignored" in "\n".join(fake_console.messages)
 
 
+def test_generate_reports_skips_report_generator_when_nothing_to_plot(monkeypatch):
+    import src.reporting.visualizations as visualizations
+
+    def fail_construction():
+        raise AssertionError("ReportGenerator should not be constructed")
+
+    monkeypatch.setattr(run_analysis, "console", FakeConsole())
+    monkeypatch.setattr(visualizations, "ReportGenerator", fail_construction)
+
+    assert run_analysis.generate_reports({}, [], one_stop_only=False) is True
+
+
+def test_spawned_report_workers_write_to_run_scoped_outputs(monkeypatch, tmp_path):
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    from src.reporting.visualizations import init_report_worker, run_report_task
+
+    run_outputs = tmp_path / "runs" / "run-1" / "outputs"
+    captured = {}
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            captured.update(kwargs)
+            super().__init__(*args, mp_context=multiprocessing.get_context("spawn"), **kwargs)
+
+    monkeypatch.setenv("HEATSTREET_WORKERS", "2")
+    monkeypatch.setattr(run_analysis, "DATA_OUTPUTS_DIR", run_outputs)
+    monkeypatch.setattr(run_analysis, "ProcessPoolExecutor", RecordingExecutor)
+    tasks = [("figure", "__getattribute__", ("output_dir",), {}, "failed")] * 2
+
+    assert run_analysis._run_report_tasks(tasks) == ["figure", "figure"]
+    assert captured["initargs"] == (run_outputs,)
+
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_report_worker,
+        initargs=(run_outputs,),
+    ) as executor:
+        worker_figures_dir = executor.submit(run_report_task, "__getattribute__", ("output_dir",)).result()
+
+    assert worker_figures_dir == run_outputs / "figures"
+
+
+def test_analyze_archetype_logs_epc_bands_d_to_g_in_order(monkeypatch, tmp_path):
+    class FakeArchetypeAnalyzer:
+        def analyze_archetype(self, df):
+            return {
+                "epc_bands": {
+                    "frequency": {"C": 1, "G": 2, "D": 5, "E": 3},
+                    "percentage": {"C": 9.1, "G": 18.2, "D": 45.5, "E": 27.3},
+                }
+            }
+
+        def save_results(self):
+            return None
+
+    analysis_logger = RecordingAnalysisLogger(tmp_path)
+    monkeypatch.setattr(run_analysis, "console", FakeConsole())
+    monkeypatch.setattr(run_analysis, "ArchetypeAnalyzer", FakeArchetypeAnalyzer)
+
+    run_analysis.analyze_archetype(pd.DataFrame({"x": range(11)}), analysis_logger)
+
+    assert [args for args, _ in analysis_logger.metrics] == [
+        ("epc_band_D", 5, "Band D: 45.5%"),
+        ("epc_band_E", 3, "Band E: 27.3%"),
+        ("epc_band_G", 2, "Band G: 18.2%"),
+    ]
+
+
+def test_check_credentials_writes_env_once_and_exports_token(monkeypatch, tmp_path):
+    token = "abcdefghijklmnop0123456789"
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env.example").write_text("EPC_API_TOKEN=placeholder\nOTHER=1\n", encoding="utf-8")
+    monkeypatch.delenv("EPC_API_TOKEN", raising=False)
+    monkeypatch.setattr(run_analysis, "console", FakeConsole())
+    monkeypatch.setattr(run_analysis.questionary, "password", lambda *args, **kwargs: DummyPrompt(f" {token} "))
+
+    assert run_analysis.check_credentials() is True
+
+    assert (tmp_path / ".env").read_text(encoding="utf-8") == f"# EPC API Credentials\nEPC_API_TOKEN={token}\n"
+    assert run_analysis.os.environ["EPC_API_TOKEN"] == token
+
+
 def test_main_returns_non_zero_when_phase_one_has_no_data(monkeypatch):
     fake_console = FakeConsole()
 
@@ -462,6 +740,42 @@ def test_validate_data_writes_normalized_report_for_dataset_reference(monkeypatc
     assert payload["invalid_records"] == 1
 
 
+def test_validate_data_writes_parquet_without_mutating_validated_frame(monkeypatch, tmp_path):
+    validated_df = pd.DataFrame(
+        {
+            "UPRN": ["1", None],
+            "CURRENT_ENERGY_RATING": pd.Categorical(["D", "E"]),
+            "TOTAL_FLOOR_AREA": [85.0, 90.0],
+        }
+    )
+
+    class FakeValidator:
+        def __init__(self, strict_schema_conflicts=False):
+            self.validation_report = {}
+
+        def validate_dataset(self, df):
+            return validated_df, {"total_records": 2, "duplicates_removed": 0}
+
+        def save_validation_report(self):
+            return None
+
+    monkeypatch.setattr(run_analysis, "console", FakeConsole())
+    monkeypatch.setattr(run_analysis, "DATA_PROCESSED_DIR", tmp_path)
+    monkeypatch.setattr(run_analysis, "EPCDataValidator", FakeValidator)
+    monkeypatch.setattr(run_analysis, "VALIDATED_PARQUET_ROW_GROUP_SIZE", 1)
+
+    df_validated, _ = run_analysis.validate_data(validated_df.copy())
+
+    assert df_validated["UPRN"].isna().tolist() == [False, True]
+    assert isinstance(df_validated["CURRENT_ENERGY_RATING"].dtype, pd.CategoricalDtype)
+    parquet = pd.read_parquet(tmp_path / "epc_london_validated.parquet")
+    assert parquet["CURRENT_ENERGY_RATING"].tolist() == ["D", "E"]
+    assert parquet["UPRN"].isna().tolist() == [False, True]
+    assert parquet["TOTAL_FLOOR_AREA"].tolist() == [85.0, 90.0]
+    assert run_analysis.pq.ParquetFile(tmp_path / "epc_london_validated.parquet").num_row_groups == 2
+    assert (tmp_path / "epc_london_validated.csv").exists()
+
+
 def test_apply_methodological_adjustments_uses_staged_helper_for_dataset_reference(monkeypatch, tmp_path):
     fake_console = FakeConsole()
     validated_ref = make_dataset_reference(
@@ -130,3 +130,17 @@ def test_main_stops_before_prompts_when_duckdb_missing(monkeypatch, tmp_path):
     assert "duckdb is not importable" in output
     assert "Startup diagnostics log saved to:" in output
     assert (Path(tmp_path) / "analysis_log.txt").exists()
+
+
+def test_print_header_skips_clear_and_panel_when_not_a_terminal(monkeypatch):
+    fake_console = FakeConsole()
+    fake_console.is_terminal = False
+    cleared = []
+    fake_console.clear = lambda: cleared.append(True)
+    monkeypatch.setattr(run_analysis, "console", fake_console)
+    monkeypatch.setattr(run_analysis, "rprint", lambda *args, **kwargs: fake_console.print(*args))
+
+    run_analysis.print_header()
+
+    assert cleared == []
+    assert fake_console.messages == []